@@ -2,6 +2,8 @@
 import json
 import os
 
+from src.gameEntry import entries_from_json, entries_to_json
+
 RECENT_FILE = "recent.json"
 MAX_RECENT = 10
 FAVORITES_FILE = "favorites.json"
@@ -10,14 +12,8 @@ def load_recent():
     if os.path.exists(RECENT_FILE):
         try:
             with open(RECENT_FILE, 'r') as f:
-                recent = json.load(f)
-                # Validate structure
-                if isinstance(recent, list):
-                    return [
-                        g for g in recent
-                        if isinstance(g, dict) and
-                        all(k in g for k in ("title", "platform", "rom_path", "cover_path"))
-                    ]
+                # Entries missing any field are dropped
+                return entries_from_json(json.load(f))
         except json.JSONDecodeError:
             print("Error: recent.json is corrupted. Resetting.")
     return []
@@ -27,7 +23,7 @@ def save_recent(game_info):
     recent = load_recent()
 
     # Remove if already exists
-    recent = [g for g in recent if g['title'] != game_info['title'] or g['platform'] != game_info['platform']]
+    recent = [g for g in recent if g.title != game_info.title or g.platform != game_info.platform]
 
     # Add to front
     recent.insert(0, game_info)
@@ -36,10 +32,9 @@ def save_recent(game_info):
     recent = recent[:MAX_RECENT]
 
     with open(RECENT_FILE, 'w') as f:
-        json.dump(recent, f, indent=2)
+        json.dump(entries_to_json(recent), f, indent=2)
 
 def load_favorites():
-    if os.path.exists(FAVORITES_FILE):
-        with open(FAVORITES_FILE, 'r') as f:
-            return json.load(f)
-    return []
+    # Served from the shared in-memory store instead of re-reading favorites.json
+    from src.favoritesStore import get_favorites_store
+    return get_favorites_store().games()
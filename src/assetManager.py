@@ -0,0 +1,136 @@
+import json
+import os
+import shutil
+from PIL import Image
+
+from src.gameEntry import DEFAULT_COVER
+
+ATLAS_DIR = os.path.join("cache", "atlas")
+ATLAS_NAME = "ui"
+ATLAS_SIZE = (1024, 512)
+ICON_SIZE = 64        # small icons are drawn at 24-32 px, so 64 px keeps them sharp on HiDPI
+LARGE_ICON_SIZE = 128  # Steam/Xbox launcher buttons
+
+# Atlas id -> longest side it is scaled to
+ATLAS_ICONS = {
+    "star": ICON_SIZE,
+    "star_empty": ICON_SIZE,
+    "star_filled": ICON_SIZE,
+    "search": ICON_SIZE,
+    "home": ICON_SIZE,
+    "joystick": ICON_SIZE,
+    "button_a": ICON_SIZE,
+    "button_b": ICON_SIZE,
+    "button_x": ICON_SIZE,
+    "button_y": ICON_SIZE,
+    "button_lb": ICON_SIZE,
+    "button_rb": ICON_SIZE,
+    "steam": LARGE_ICON_SIZE,
+    "xbox": LARGE_ICON_SIZE,
+}
+DEFAULT_COVER_ID = "default_cover"
+
+
+def _asset_id(path):
+    # "assets/star_empty.png" -> "star_empty"; names are matched case-insensitively ("Steam.png")
+    return os.path.splitext(os.path.basename(path))[0].lower()
+
+
+class AssetManager:
+    """
+    Packs the small UI icons and a thumbnail-sized default cover into one Kivy atlas,
+    so every star, HUD button and tab icon, and every tile without box art, draws
+    from a single texture uploaded once. The atlas is rebuilt only when an asset or
+    the thumbnail size changes. Anything not in the atlas is served from its file.
+    """
+
+    def __init__(self, assets_dir=os.path.dirname(DEFAULT_COVER), cover_size=(150, 212)):
+        self.assets_dir = assets_dir
+        self.cover_size = tuple(cover_size)
+        self._files = self._find_files()
+        self._ids = set()
+
+        try:
+            self._ids = self._load_or_build()
+        except Exception as e:
+            print(f"[WARN] Could not build the UI atlas, loading icons individually: {e}")
+
+    def _find_files(self):
+        # atlas id -> file on disk; the repo folder is "Assets/" while code refers to "assets/"
+        for directory in (self.assets_dir, self.assets_dir.capitalize()):
+            if os.path.isdir(directory):
+                return {_asset_id(name): os.path.join(directory, name)
+                        for name in sorted(os.listdir(directory)) if name.lower().endswith(".png")}
+        return {}
+
+    def _wanted(self):
+        wanted = {asset_id: size for asset_id, size in ATLAS_ICONS.items() if asset_id in self._files}
+        if DEFAULT_COVER_ID in self._files:
+            wanted[DEFAULT_COVER_ID] = self.cover_size
+        return wanted
+
+    def _stamp(self, wanted):
+        # Everything that affects the atlas's contents
+        stamp = {"cover_size": list(self.cover_size)}
+        for asset_id in wanted:
+            st = os.stat(self._files[asset_id])
+            stamp[asset_id] = [st.st_mtime_ns, st.st_size]
+        return stamp
+
+    def _load_or_build(self):
+        wanted = self._wanted()
+        if not wanted:
+            return set()
+
+        atlas_path = os.path.join(ATLAS_DIR, ATLAS_NAME + ".atlas")
+        stamp_path = os.path.join(ATLAS_DIR, ATLAS_NAME + ".stamp")
+        stamp = self._stamp(wanted)
+
+        try:
+            with open(stamp_path, 'r') as f:
+                if json.load(f) == stamp and os.path.exists(atlas_path):
+                    return set(wanted)
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        self._build(wanted)
+        with open(stamp_path, 'w') as f:
+            json.dump(stamp, f)
+        return set(wanted)
+
+    def _build(self, wanted):
+        from kivy.atlas import Atlas
+
+        # Scale every asset down to the size it's drawn at, then let Kivy pack them
+        staging = os.path.join(ATLAS_DIR, "staging")
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        filenames = []
+        for asset_id, size in wanted.items():
+            box = size if isinstance(size, tuple) else (size, size)
+            with Image.open(self._files[asset_id]) as img:
+                img = img.convert("RGBA")
+                img.thumbnail(box, Image.Resampling.LANCZOS)
+                filename = os.path.join(staging, asset_id + ".png")
+                img.save(filename)
+            filenames.append(filename)
+
+        for name in os.listdir(ATLAS_DIR):
+            if name.startswith(ATLAS_NAME + "-") or name == ATLAS_NAME + ".atlas":
+                os.remove(os.path.join(ATLAS_DIR, name))
+        Atlas.create(os.path.join(ATLAS_DIR, ATLAS_NAME), filenames, ATLAS_SIZE)
+        shutil.rmtree(staging, ignore_errors=True)
+
+    def source(self, path):
+        """
+        Image source to use for an asset path such as "assets/star_empty.png".
+        """
+        asset_id = _asset_id(path)
+        if asset_id in self._ids:
+            return f"atlas://{ATLAS_DIR.replace(os.sep, '/')}/{ATLAS_NAME}/{asset_id}"
+        return self._files.get(asset_id, path)
+
+    @property
+    def default_cover(self):
+        return self.source(DEFAULT_COVER)
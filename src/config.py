@@ -0,0 +1,38 @@
+import json
+import os
+
+CONFIG_FILE = "config.json"
+
+# Every setting the launcher understands, with the value used when config.json doesn't override it
+DEFAULT_CONFIG = {
+    "scan_workers": 4,
+    "thumbnail_size": [150, 212],
+    "thumbnail_cache_mb": 200,
+    "cover_workers": 2,
+    "prefetch_adjacent_tabs": True,
+    "watch_library": True,
+    "watch_interval": 2.0,
+    "library_db": False,
+    "fingerprint_roms": False,
+    "hash_workers": 2,
+    "prewarm": False,
+    "prewarm_dwell": 1.0,
+    "prewarm_rom_mb": 64,
+}
+
+
+def load_config():
+    """
+    Reads config.json and returns the default settings overlaid with the user's overrides.
+    A missing or corrupted config file just means the defaults are used.
+    """
+    config = dict(DEFAULT_CONFIG)
+    if os.path.exists(CONFIG_FILE):
+        try:
+            with open(CONFIG_FILE, 'r') as f:
+                overrides = json.load(f)
+            if isinstance(overrides, dict):
+                config.update(overrides)
+        except (json.JSONDecodeError, OSError):
+            print(f"Error: {CONFIG_FILE} is corrupted. Using default settings.")
+    return config
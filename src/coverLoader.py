@@ -0,0 +1,203 @@
+import heapq
+import itertools
+import threading
+from collections import OrderedDict
+from PIL import Image
+
+from kivy.clock import Clock
+from kivy.core.image import Image as CoreImage
+from kivy.graphics.texture import Texture
+
+from src.thumbnailCache import get_thumbnail, THUMBNAIL_SIZE, MAX_CACHE_BYTES
+
+DEFAULT_COVER_WORKERS = 2
+TEXTURE_CACHE_SIZE = 200  # decoded covers kept on the GPU for tiles scrolling back into view
+
+PRIORITY_VISIBLE = 0
+PRIORITY_PREFETCH = 1
+
+
+class CoverRequest:
+    """
+    Handle returned by CoverLoader.request(); cancel() drops it if it hasn't run yet
+    and guarantees its callback is never called.
+    """
+
+    __slots__ = ("path", "callback", "cancelled")
+
+    def __init__(self, path, callback):
+        self.path = path
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _CoverJob:
+    # One queued or decoding cover and every request waiting for it
+    __slots__ = ("priority", "waiters", "decoding")
+
+    def __init__(self, priority):
+        self.priority = priority
+        self.waiters = []
+        self.decoding = False
+
+    def wanted(self):
+        return any(not req.cancelled for req in self.waiters)
+
+    def wants_pixels(self):
+        # Prefetches (no callback) only need the thumbnail on disk
+        return any(not req.cancelled and req.callback is not None for req in self.waiters)
+
+
+class CoverLoader:
+    """
+    Decodes cover thumbnails on a small pool of worker threads so tiles never block
+    the UI while scrolling. Workers generate/read the cached thumbnail and decode it
+    to raw pixels; only the texture upload happens on the main thread. Visible tiles
+    are served before prefetches, and recently used textures are kept in an LRU.
+    A cover is only ever queued once: further requests for it wait on the same job.
+    """
+
+    def __init__(self, workers=DEFAULT_COVER_WORKERS, size=THUMBNAIL_SIZE, max_bytes=MAX_CACHE_BYTES):
+        self.size = tuple(size)
+        self.max_bytes = max_bytes
+        self._textures = OrderedDict()  # path -> Texture, main thread only
+        self._static = {}               # atlas/file source -> Texture, main thread only
+        self._queue = []                # (priority, seq, path)
+        self._jobs = {}                 # path -> _CoverJob, queued or decoding
+        self._prefetches = []           # CoverRequests from the last prefetch()
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+
+        for _ in range(workers):
+            threading.Thread(target=self._work, daemon=True).start()
+
+    def request(self, path, callback, priority=PRIORITY_VISIBLE):
+        """
+        Calls callback(texture) on the main thread once the cover at path is ready.
+        Must be called from the main thread. A cached texture is delivered immediately
+        and None is returned; otherwise returns a CoverRequest that can be cancelled.
+        """
+        texture = self._textures.get(path)
+        if texture is not None:
+            self._textures.move_to_end(path)
+            callback(texture)
+            return None
+
+        req = CoverRequest(path, callback)
+        self._enqueue(priority, req)
+        return req
+
+    def static_texture(self, source):
+        """
+        Texture for a bundled image or atlas region (the default cover, the placeholder),
+        loaded once on the main thread and shared by every tile that shows it.
+        Returns None if the source can't be loaded.
+        """
+        if source not in self._static:
+            try:
+                self._static[source] = CoreImage(source).texture
+            except Exception as e:
+                print(f"[WARN] Could not load {source}: {e}")
+                self._static[source] = None
+        return self._static[source]
+
+    def prefetch(self, paths):
+        """
+        Warms the on-disk thumbnails of tiles about to scroll into view; nothing is
+        uploaded. Replaces the previous prefetch: covers it asked for that aren't in
+        paths are no longer near the viewport and are dropped if they haven't run yet.
+        """
+        paths = {path for path in paths if path not in self._textures}
+        for req in self._prefetches:
+            if req.path not in paths:
+                req.cancel()
+            else:
+                paths.discard(req.path)  # still queued from last time
+        self._prefetches = [req for req in self._prefetches if not req.cancelled]
+        for path in paths:
+            req = CoverRequest(path, None)
+            self._enqueue(PRIORITY_PREFETCH, req)
+            self._prefetches.append(req)
+
+    def _enqueue(self, priority, req):
+        with self._cond:
+            job = self._jobs.get(req.path)
+            if job is None:
+                job = self._jobs[req.path] = _CoverJob(priority)
+            elif job.decoding or priority >= job.priority:
+                job.waiters.append(req)
+                return
+            # New, or a prefetch that is now needed by a visible tile: (re)queue at the
+            # higher priority; whichever heap entry is popped second finds the job taken
+            job.priority = priority
+            job.waiters.append(req)
+            heapq.heappush(self._queue, (priority, next(self._seq), req.path))
+            self._cond.notify()
+
+    def _drop(self, path):
+        with self._cond:
+            self._jobs.pop(path, None)
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._queue.clear()
+            self._jobs.clear()
+            self._cond.notify_all()
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                _, _, path = heapq.heappop(self._queue)
+                job = self._jobs.get(path)
+                if job is None or job.decoding:
+                    continue  # already handled through another heap entry
+                if not job.wanted():
+                    del self._jobs[path]  # every tile that asked scrolled away
+                    continue
+                job.decoding = True
+
+            thumb_path = get_thumbnail(path, self.size, self.max_bytes)
+            with self._cond:
+                if not job.wants_pixels():
+                    self._jobs.pop(path, None)
+                    continue
+
+            try:
+                with Image.open(thumb_path) as img:
+                    img = img.convert("RGBA")
+                    # get_thumbnail hands back the original file if it couldn't scale it
+                    img.thumbnail(self.size, Image.Resampling.LANCZOS)
+                    pixels = (img.size, img.tobytes())
+            except Exception as e:
+                print(f"[ERROR] Could not decode cover {path}: {e}")
+                self._drop(path)
+                continue
+
+            Clock.schedule_once(lambda dt, path=path, pixels=pixels: self._deliver(path, pixels))
+
+    def _deliver(self, path, pixels):
+        # Main thread: upload once, then hand the texture to every tile that still wants it
+        with self._cond:
+            job = self._jobs.pop(path, None)
+        texture = self._textures.get(path)
+        if texture is None:
+            size, data = pixels
+            texture = Texture.create(size=size, colorfmt="rgba")
+            texture.blit_buffer(data, colorfmt="rgba", bufferfmt="ubyte")
+            texture.flip_vertical()  # PIL rows run top to bottom, GL textures bottom to top
+            self._textures[path] = texture
+            while len(self._textures) > TEXTURE_CACHE_SIZE:
+                self._textures.popitem(last=False)
+
+        for req in job.waiters if job is not None else ():
+            if not req.cancelled and req.callback is not None:
+                req.callback(texture)
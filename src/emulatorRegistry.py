@@ -0,0 +1,191 @@
+import json
+import os
+import shutil
+import sys
+import threading
+
+EMULATORS_FILE = "emulators.json"
+
+# Keys an emulator or platform entry may set; later layers override earlier ones
+ENTRY_KEYS = ("path", "args", "cwd", "env", "rom")
+DEFAULT_CWD = "{emulator_dir}"
+TEMPLATE_FIELDS = {"rom": "", "rom_dir": "", "rom_name": "", "emulator_dir": ""}
+
+if sys.platform.startswith("win"):
+    HOST_OS = "windows"
+elif sys.platform == "darwin":
+    HOST_OS = "macos"
+else:
+    HOST_OS = "linux"
+
+
+def _wiiu_rpx(rom_path):
+    # Cemu wants the .rpx inside code/ when given an extracted title folder
+    code_dir = os.path.join(rom_path, "code")
+    if os.path.isdir(code_dir):
+        for name in os.listdir(code_dir):
+            if name.lower().endswith(".rpx"):
+                return os.path.join(code_dir, name)
+    return rom_path
+
+
+# Named ROM path rewrites a platform can opt into with "rom": "<name>"
+ROM_RESOLVERS = {
+    "wiiu_rpx": _wiiu_rpx,
+}
+
+
+class Emulator:
+    """
+    A platform's emulator with everything resolved up front: the absolute executable,
+    the argument template, working directory and environment. Launching only has to
+    fill in the ROM.
+    """
+
+    __slots__ = ("platform", "name", "executable", "args", "cwd", "env", "rom_resolver")
+
+    def __init__(self, platform, name, executable, args, cwd, env, rom_resolver):
+        self.platform = platform
+        self.name = name
+        self.executable = executable
+        self.args = args
+        self.cwd = cwd
+        self.env = env
+        self.rom_resolver = rom_resolver
+
+    def command(self, rom_path):
+        """
+        Full argv for rom_path, which must already be absolute.
+        """
+        if self.rom_resolver is not None:
+            rom_path = self.rom_resolver(rom_path)
+        fields = {
+            "rom": rom_path,
+            "rom_dir": os.path.dirname(rom_path),
+            "rom_name": os.path.basename(rom_path),
+            "emulator_dir": os.path.dirname(self.executable),
+        }
+        return [self.executable] + [arg.format(**fields) for arg in self.args]
+
+
+def _layer(entry, host_os=HOST_OS):
+    # An entry's own keys, then the ones under its host OS section
+    layer = {key: entry[key] for key in ENTRY_KEYS if key in entry}
+    if isinstance(entry.get(host_os), dict):
+        layer.update({key: value for key, value in entry[host_os].items() if key in ENTRY_KEYS})
+    return layer
+
+
+def _find_executable(path):
+    # Relative paths are bundled emulators; bare names ("dolphin-emu") are looked up on PATH
+    if os.path.dirname(path):
+        path = os.path.abspath(path)
+        return path if os.path.isfile(path) else None
+    return shutil.which(path)
+
+
+class EmulatorRegistry:
+    """
+    Platform -> Emulator table loaded from emulators.json. Every entry is validated
+    and resolved once when the registry is built, and platforms whose emulator is
+    missing or misconfigured are reported then, once, instead of on every launch.
+    """
+
+    def __init__(self, path=EMULATORS_FILE, host_os=HOST_OS):
+        self.path = path
+        self.host_os = host_os
+        self._emulators = {}
+        self.missing = {}  # platform -> reason it can't be launched
+
+        config = self._load()
+        emulators = config.get("emulators", {})
+        for platform, platform_entry in config.get("platforms", {}).items():
+            try:
+                self._emulators[platform] = self._resolve(platform, platform_entry, emulators)
+            except ValueError as e:
+                self.missing[platform] = str(e)
+
+        for platform, reason in sorted(self.missing.items()):
+            print(f"[WARN] {platform} games can't be launched: {reason}")
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            print(f"Error: {self.path} not found. No emulators configured.")
+            return {}
+        try:
+            with open(self.path, 'r', encoding="utf-8") as f:
+                config = json.load(f)
+            if isinstance(config, dict):
+                return config
+        except (json.JSONDecodeError, OSError):
+            pass
+        print(f"Error: {self.path} is corrupted. No emulators configured.")
+        return {}
+
+    def _resolve(self, platform, platform_entry, emulators):
+        if not isinstance(platform_entry, dict):
+            raise ValueError("entry must be an object")
+        name = platform_entry.get("emulator")
+        if not isinstance(emulators.get(name), dict):
+            raise ValueError(f"unknown emulator {name!r}")
+
+        settings = {"args": ["{rom}"], "cwd": DEFAULT_CWD, "env": {}}
+        settings.update(_layer(emulators[name], self.host_os))
+        settings.update(_layer(platform_entry, self.host_os))
+
+        if not settings.get("path"):
+            raise ValueError(f"{name} has no {self.host_os} build configured")
+        executable = _find_executable(settings["path"])
+        if executable is None:
+            raise ValueError(f"{name} not found at {settings['path']}")
+
+        args = settings["args"]
+        if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+            raise ValueError(f"{name} args must be a list of strings")
+        try:
+            for arg in args:
+                arg.format(**TEMPLATE_FIELDS)
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError(f"bad argument template in {name}: {e}")
+
+        rom_resolver = None
+        if settings.get("rom"):
+            rom_resolver = ROM_RESOLVERS.get(settings["rom"])
+            if rom_resolver is None:
+                raise ValueError(f"unknown ROM resolver {settings['rom']!r}")
+
+        # cwd and env are fixed per emulator, so they may only refer to its own directory
+        emulator_dir = os.path.dirname(executable)
+        try:
+            cwd = os.path.abspath(settings["cwd"].format(emulator_dir=emulator_dir))
+            env = None
+            if settings["env"]:
+                env = dict(os.environ)
+                env.update({key: str(value).format(emulator_dir=emulator_dir)
+                            for key, value in settings["env"].items()})
+        except (KeyError, IndexError, ValueError, AttributeError) as e:
+            raise ValueError(f"bad cwd/env template in {name}: {e}")
+
+        return Emulator(platform, name, executable, tuple(args), cwd, env, rom_resolver)
+
+    def get(self, platform):
+        """
+        The resolved Emulator for platform, or None if it has none.
+        """
+        return self._emulators.get(platform)
+
+    def platforms(self):
+        return list(self._emulators)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    # Built (and missing emulators reported) by the first caller, normally the UI at startup
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = EmulatorRegistry()
+        return _registry
@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+
+from src.gameEntry import entries_from_json, entries_to_json
+
+FAVORITES_FILE = "favorites.json"
+SAVE_DELAY = 1.0  # seconds to wait for more toggles before writing to disk
+
+
+class FavoritesStore:
+    """
+    Process-wide favorites, loaded from favorites.json once. Membership checks are set
+    lookups keyed by (platform, rom_path); changes are written back on a timer so a
+    burst of toggles costs one atomic write instead of one per press.
+    """
+
+    def __init__(self, path=FAVORITES_FILE, save_delay=SAVE_DELAY):
+        self.path = path
+        self.save_delay = save_delay
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # the timer and on_stop may flush at the same time
+        self._games = []    # newest first, as shown on the Home screen
+        self._keys = set()
+        self._timer = None
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                favorites = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            print(f"Error: {self.path} is corrupted. Starting with no favorites.")
+            return
+
+        for game in entries_from_json(favorites):
+            if game.key not in self._keys:
+                self._keys.add(game.key)
+                self._games.append(game)
+
+    def contains(self, game_info):
+        return game_info.key in self._keys
+
+    def games(self):
+        with self._lock:
+            return list(self._games)
+
+    def toggle(self, game_info):
+        """
+        Adds or removes the game and returns True if it is now a favorite.
+        """
+        key = game_info.key
+        with self._lock:
+            if key in self._keys:
+                self._keys.discard(key)
+                self._games = [g for g in self._games if g.key != key]
+                is_favorited = False
+            else:
+                self._keys.add(key)
+                self._games.insert(0, game_info)
+                is_favorited = True
+            self._dirty = True
+            self._schedule_save()
+        return is_favorited
+
+    def _schedule_save(self):
+        # Restart the countdown on every change so rapid toggles are coalesced
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.save_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """
+        Writes pending changes now. Called by the save timer and when the launcher exits.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            snapshot = entries_to_json(self._games)
+            self._dirty = False
+
+        # Write to a temp file and rename so a crash never leaves a truncated favorites.json
+        tmp_path = self.path + ".tmp"
+        with self._write_lock:
+            try:
+                with open(tmp_path, 'w') as f:
+                    json.dump(snapshot, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"[ERROR] Could not save favorites: {e}")
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_favorites_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = FavoritesStore()
+        return _store
@@ -0,0 +1,108 @@
+import os
+import sys
+
+DEFAULT_COVER = sys.intern(os.path.join("assets", "default_cover.png"))
+
+GAME_FIELDS = ("title", "platform", "rom_path", "cover_path")
+
+
+def _split_dir(path):
+    # Splits after the last separator so dir + name gives back the exact original string,
+    # whichever separators ("ROMs/SNES\\game.sfc") the path was built with
+    cut = max(path.rfind("/"), path.rfind("\\")) + 1
+    return sys.intern(path[:cut]), path[cut:]
+
+
+class GameEntry:
+    """
+    One game in the library. Entries are immutable and slotted: the platform and the
+    ROM/cover directory prefixes are interned so thousands of games share one copy of
+    each, and every game without its own art points at the same DEFAULT_COVER string.
+    Equality and hashing cover all four fields; `key` is the (platform, rom_path) pair
+    favorites and recents identify a game by.
+    """
+
+    __slots__ = ("title", "platform", "_rom_dir", "_rom_name", "_cover_dir", "_cover_name", "_hash")
+
+    def __init__(self, title, platform, rom_path, cover_path=DEFAULT_COVER):
+        set_field = object.__setattr__
+        set_field(self, "title", title)
+        set_field(self, "platform", sys.intern(platform))
+        rom_dir, rom_name = _split_dir(rom_path)
+        set_field(self, "_rom_dir", rom_dir)
+        set_field(self, "_rom_name", rom_name)
+        if not cover_path or cover_path == DEFAULT_COVER:
+            set_field(self, "_cover_dir", "")
+            set_field(self, "_cover_name", DEFAULT_COVER)
+        else:
+            cover_dir, cover_name = _split_dir(cover_path)
+            set_field(self, "_cover_dir", cover_dir)
+            set_field(self, "_cover_name", cover_name)
+        set_field(self, "_hash", hash(self._fields()))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GameEntry is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("GameEntry is immutable")
+
+    @property
+    def rom_path(self):
+        return self._rom_dir + self._rom_name
+
+    @property
+    def cover_path(self):
+        return self._cover_dir + self._cover_name
+
+    @property
+    def has_default_cover(self):
+        return self._cover_name is DEFAULT_COVER
+
+    @property
+    def key(self):
+        return self.platform, self.rom_path
+
+    def _fields(self):
+        return self.title, self.platform, self._rom_dir, self._rom_name, self._cover_dir, self._cover_name
+
+    def __eq__(self, other):
+        if not isinstance(other, GameEntry):
+            return NotImplemented
+        return self._hash == other._hash and self._fields() == other._fields()
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return f"GameEntry({self.title!r}, {self.platform!r}, {self.rom_path!r}, {self.cover_path!r})"
+
+    def replace(self, **changes):
+        """
+        Returns a copy with some fields changed, e.g. entry.replace(cover_path=new_cover).
+        """
+        fields = self.to_dict()
+        fields.update(changes)
+        return GameEntry(**fields)
+
+    def to_dict(self):
+        # The four-key layout stored in favorites.json, recent.json and the library index
+        return {"title": self.title, "platform": self.platform, "rom_path": self.rom_path, "cover_path": self.cover_path}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Builds an entry from a JSON dict, or returns None if it is missing any field.
+        """
+        if not isinstance(data, dict) or not all(isinstance(data.get(k), str) for k in GAME_FIELDS):
+            return None
+        return cls(data["title"], data["platform"], data["rom_path"], data["cover_path"])
+
+
+def entries_from_json(items):
+    # Converts a JSON list of game dicts, skipping anything malformed
+    entries = (GameEntry.from_dict(item) for item in items) if isinstance(items, list) else ()
+    return [entry for entry in entries if entry is not None]
+
+
+def entries_to_json(entries):
+    return [entry.to_dict() for entry in entries]
@@ -1,75 +1,234 @@
+import itertools
+import json
 import os
 import subprocess
+import threading
+import time
+
+from src.emulatorRegistry import get_registry
+
+LOG_DIR = "logs"
+SESSION_LOG_NAME = "sessions.jsonl"  # one JSON line per finished session, inside LOG_DIR
+POLL_INTERVAL = 0.5      # seconds between checks of the running emulators
+STDERR_TAIL_BYTES = 4096  # how much of an emulator's stderr is kept with its session
+MAX_HISTORY = 50         # finished sessions kept in memory for the UI
+
+
+def launch_game(platform, rom_path, stderr=None):
+    """
+    Launches the appropriate emulator with the given ROM.
+    Returns subprocess.Popen so UI can wait() and rebind input, or None if the platform
+    has no usable emulator (already reported when the registry was built).
+    stderr is passed to Popen, e.g. an open log file.
+    """
+    emulator = get_registry().get(platform)
+    if emulator is None:
+        return None
 
-# Maps each platform to its emulator path
-EMULATOR_MAP = {
-    "NES": "Emulators/Mesen/Mesen_2.1.0_Windows/Mesen.exe",
-    "SNES": "Emulators/Bsnes/bsnes/bsnes.exe",
-    "N64": "Emulators/Project64/Release/Project64.exe",
-    "GBA": "Emulators/mGBA/mGBA/mGBA.exe",
-    "GameCube": "Emulators/Dolphin/Dolphin-x64/Dolphin.exe",
-    "Wii": "Emulators/Dolphin/Dolphin-x64/Dolphin.exe",
-    "WiiU": "Emulators/Cemu/Cemu/Cemu.exe",
-    "PS1": "Emulators/DuckStation/Duckstation/duckstation-qt-x64-ReleaseLTCG.exe",
-    "PS2": "Emulators/PCSX2/pcsx2-qt.exe",
-    "PS3": "Emulators/RPCS3/rpcs3.exe",
-    "Xbox": "Emulators/Xemu/xemu.exe",
-    "Xbox360": "Emulators/Xenia/xenia.exe"
-}
-
-
-def _popen_with_cwd(emulator_path, args):
-    emulator_path = os.path.abspath(emulator_path)
-    emu_dir = os.path.dirname(emulator_path)
     DETACHED_PROCESS = 0x00000008
     CREATE_NEW_PROCESS_GROUP = 0x00000200
-    flags = DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
+    # creationflags only exist on Windows; Popen rejects them elsewhere
+    flags = DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0
     return subprocess.Popen(
-        [emulator_path] + args,
-        cwd=emu_dir,
+        emulator.command(os.path.abspath(rom_path)),
+        cwd=emulator.cwd,
+        env=emulator.env,
+        stderr=stderr,
         creationflags=flags
     )
 
-def _resolve_wiiu_path(p):
-    p = os.path.abspath(p)
-    if os.path.isdir(p):
-        code_dir = os.path.join(p, "code")
-        if os.path.isdir(code_dir):
-            # pick the first .rpx in code/
-            for f in os.listdir(code_dir):
-                if f.lower().endswith(".rpx"):
-                    return os.path.join(code_dir, f)
-    return p
 
+class EmulatorSession:
+    """
+    One run of an emulator: what was launched, how long spawning it took, and once it
+    has exited, how long it ran, its exit code and the tail of its stderr.
+    """
+
+    def __init__(self, platform, rom_path, title, log_path):
+        self.platform = platform
+        self.rom_path = rom_path
+        self.title = title
+        self.log_path = log_path
+        self.pid = None
+        self.started_at = time.time()
+        self.launch_latency = None  # seconds spent starting the process
+        self.window_latency = None  # seconds until the emulator's window took focus, if seen
+        self.prewarmed = False
+        self.duration = None
+        self.exit_code = None
+        self.stderr_tail = ""
+        self._started = time.monotonic()
+        self._proc = None
+
+    @property
+    def key(self):
+        return (self.platform, self.rom_path)
+
+    def elapsed(self):
+        return time.monotonic() - self._started
+
+    @property
+    def running(self):
+        return self.exit_code is None
+
+    @property
+    def crashed(self):
+        return self.exit_code not in (None, 0)
 
-def launch_game(platform, rom_path):
+    def to_dict(self):
+        return {
+            "platform": self.platform,
+            "rom_path": self.rom_path,
+            "title": self.title,
+            "pid": self.pid,
+            "started_at": self.started_at,
+            "launch_latency": self.launch_latency,
+            "window_latency": self.window_latency,
+            "prewarmed": self.prewarmed,
+            "duration": self.duration,
+            "exit_code": self.exit_code,
+            "stderr_tail": self.stderr_tail,
+            "log_path": self.log_path,
+        }
+
+
+def _read_tail(path, size=STDERR_TAIL_BYTES):
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - size))
+            return f.read().decode("utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+class EmulatorSupervisor:
     """
-    Launches the appropriate emulator with the given ROM.
-    Returns subprocess.Popen so UI can wait() and rebind input.
+    Launches emulators and watches every running one from a single monitor thread
+    (started on demand, exits when nothing is running). Each session's stderr goes
+    to its own log file; when the process exits the session is finished, appended
+    to logs/sessions.jsonl and passed to the on_exit listeners, which are called on
+    the monitor thread. A game that is already running is not launched again.
     """
-    emulator_path = EMULATOR_MAP.get(platform)
-    if not emulator_path:
-        print(f"[ERROR] No emulator configured for platform: {platform}")
-        return None
-    if not os.path.exists(emulator_path):
-        print(f"[ERROR] Emulator not found: {emulator_path}")
-        return None
 
-    # >>> CRITICAL LINE: make ROM path absolute <<<
-    rom_path = os.path.abspath(rom_path)
+    def __init__(self, log_dir=LOG_DIR, poll_interval=POLL_INTERVAL):
+        self.log_dir = log_dir
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._running = {}  # (platform, rom_path) -> EmulatorSession
+        self._history = []  # finished sessions, newest last
+        self._listeners = []
+        self._monitor = None
+        self._seq = itertools.count(1)
 
-    # Optional: sanity check to help debug bad paths
-    if not os.path.exists(rom_path):
-        print(f"[ERROR] ROM path does not exist: {rom_path}")
-        return None
+    def add_listener(self, on_exit):
+        self._listeners.append(on_exit)
+
+    def launch(self, platform, rom_path, title=None):
+        """
+        Starts the emulator for rom_path and returns its EmulatorSession, or None if
+        the launch failed or that game is already running.
+        """
+        rom_path = os.path.abspath(rom_path)
+        os.makedirs(self.log_dir, exist_ok=True)
+        log_name = f"{time.strftime('%Y%m%d-%H%M%S')}-{platform}-{next(self._seq)}.log"
+        session = EmulatorSession(platform, rom_path, title or os.path.basename(rom_path),
+                                  os.path.join(self.log_dir, log_name))
+
+        with self._lock:
+            if session.key in self._running:
+                print(f"[WARN] {session.title} is already running")
+                return None
+            # Claim the game before spawning so a second press can't start it twice
+            self._running[session.key] = session
+
+        try:
+            with open(session.log_path, 'wb') as log:
+                # The child keeps its own handle to the log; ours can close straight away
+                proc = launch_game(platform, rom_path, stderr=log)
+        except OSError as e:
+            print(f"[ERROR] Could not start the {platform} emulator: {e}")
+            proc = None
+        session.launch_latency = time.monotonic() - session._started
+
+        with self._lock:
+            if proc is None:
+                del self._running[session.key]
+            else:
+                session._proc = proc
+                session.pid = proc.pid
+                if self._monitor is None:
+                    self._monitor = threading.Thread(target=self._watch, daemon=True)
+                    self._monitor.start()
+
+        if proc is None:
+            try:
+                os.remove(session.log_path)
+            except OSError:
+                pass
+            return None
+        return session
+
+    def is_running(self, platform, rom_path):
+        with self._lock:
+            return (platform, os.path.abspath(rom_path)) in self._running
+
+    def running(self):
+        with self._lock:
+            return list(self._running.values())
+
+    def history(self):
+        with self._lock:
+            return list(self._history)
+
+    def _watch(self):
+        while True:
+            time.sleep(self.poll_interval)
+            with self._lock:
+                exited = [s for s in self._running.values() if s._proc is not None and s._proc.poll() is not None]
+                for session in exited:
+                    del self._running[session.key]
+                if not self._running and not exited:
+                    self._monitor = None
+                    return
+
+            for session in exited:
+                self._finish(session)
+
+    def _finish(self, session):
+        session.exit_code = session._proc.returncode
+        session.duration = time.monotonic() - session._started
+        session.stderr_tail = _read_tail(session.log_path)
+        session._proc = None
+
+        with self._lock:
+            self._history.append(session)
+            del self._history[:-MAX_HISTORY]
+
+        try:
+            with open(os.path.join(self.log_dir, SESSION_LOG_NAME), 'a', encoding="utf-8") as f:
+                f.write(json.dumps(session.to_dict()) + "\n")
+        except OSError as e:
+            print(f"[WARN] Could not record emulator session: {e}")
+
+        if session.crashed:
+            print(f"[WARN] {session.platform} emulator exited with code {session.exit_code} "
+                  f"after {session.duration:.1f}s running {session.title}")
+
+        for on_exit in self._listeners:
+            try:
+                on_exit(session)
+            except Exception as e:
+                print(f"[ERROR] Emulator exit listener failed: {e}")
+
+
+_supervisor = None
+_supervisor_lock = threading.Lock()
 
-    if platform == "WiiU":
-        rom_path = _resolve_wiiu_path(rom_path)
-        return _popen_with_cwd(emulator_path, ["-f", "-g", rom_path])
 
-    elif platform == "PS3":
-        return _popen_with_cwd(emulator_path, [rom_path])
-    elif platform == "Xbox":
-        return _popen_with_cwd(emulator_path, ["-dvd_path", rom_path])
-    else:
-        return _popen_with_cwd(emulator_path, [rom_path])
+def get_supervisor():
+    global _supervisor
+    with _supervisor_lock:
+        if _supervisor is None:
+            _supervisor = EmulatorSupervisor()
+        return _supervisor
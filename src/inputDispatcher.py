@@ -0,0 +1,314 @@
+from bisect import bisect_right
+
+from kivy.clock import Clock
+
+# Commands
+UP = "up"
+DOWN = "down"
+LEFT = "left"
+RIGHT = "right"
+ACCEPT = "accept"
+FAVORITE = "favorite"
+PREV_TAB = "prev_tab"
+NEXT_TAB = "next_tab"
+PAGE_UP = "page_up"
+PAGE_DOWN = "page_down"
+PREV_LETTER = "prev_letter"
+NEXT_LETTER = "next_letter"
+
+# Focus states
+TAB = "tab"
+GRID = "grid"
+
+KEY_COMMANDS = {
+    "up": UP,
+    "down": DOWN,
+    "left": LEFT,
+    "right": RIGHT,
+    "enter": ACCEPT,
+    "numpadenter": ACCEPT,
+    "pageup": PAGE_UP,
+    "pagedown": PAGE_DOWN,
+}
+
+BUTTON_COMMANDS = {
+    0: ACCEPT,     # A
+    3: FAVORITE,   # Y
+    4: PREV_TAB,   # LB
+    5: NEXT_TAB,   # RB
+    11: UP,        # D-pad reported as buttons on some pads
+    12: DOWN,
+    13: LEFT,
+    14: RIGHT,
+}
+
+HAT_COMMANDS = {
+    (0, 1): UP,
+    (0, -1): DOWN,
+    (-1, 0): LEFT,
+    (1, 0): RIGHT,
+}
+
+# Stick axes -> (command for negative values, command for positive values).
+# The left stick moves a tile at a time, the right stick's vertical axis a page at a time.
+STICK_COMMANDS = {
+    0: (LEFT, RIGHT),        # left stick X
+    1: (UP, DOWN),           # left stick Y
+    3: (PAGE_UP, PAGE_DOWN), # right stick Y
+}
+
+# Analog triggers: held past TRIGGER_THRESHOLD they jump a letter at a time
+TRIGGER_COMMANDS = {
+    4: PREV_LETTER,  # LT
+    5: NEXT_LETTER,  # RT
+}
+
+# Commands that keep firing while their stick/hat/button/trigger is held
+REPEATABLE = {UP, DOWN, LEFT, RIGHT, PAGE_UP, PAGE_DOWN, PREV_LETTER, NEXT_LETTER}
+
+AXIS_DEADZONE = 0.35
+TRIGGER_THRESHOLD = 0.5
+AXIS_MAX = 32767.0        # SDL reports raw axis values; they're normalised to -1..1
+
+REPEAT_DELAY = 0.35       # seconds held before the first repeat
+REPEAT_INTERVAL = 0.12    # seconds between the first repeats
+REPEAT_MIN_INTERVAL = 0.03
+REPEAT_ACCELERATION = 0.85  # each repeat comes this much sooner, down to the minimum
+
+
+class InputDispatcher:
+    """
+    Translates keyboard and controller events into commands and runs them through a
+    two-state focus machine (tab bar or game grid). It owns the navigation state:
+    the mode, the highlighted tab, and the focused grid and index. Focus is an index
+    into the grid's data, so a move only touches the tile losing focus and the one
+    gaining it, whatever the size of the library. Bind its on_* methods to the Window.
+    """
+
+    def __init__(self, app, deadzone=AXIS_DEADZONE):
+        self.app = app
+        self.deadzone = deadzone
+        self.mode = TAB
+        self.tab_index = 0     # highlighted tab, which may differ from the one shown
+        self.grid = None       # GameGrid of the screen being navigated
+        self.index = 0         # focused tile in self.grid
+        self._lit_tab = None   # tag of the tab button currently highlighted
+        self._held = None      # (source, command) auto-repeating while held
+        self._repeat_interval = REPEAT_INTERVAL
+        self._repeat_event = None
+
+        self._handlers = {
+            (TAB, LEFT): lambda: self._move_tab(-1),
+            (TAB, RIGHT): lambda: self._move_tab(1),
+            (TAB, DOWN): self._enter_grid,
+            (TAB, ACCEPT): self._select_tab,
+            (GRID, LEFT): lambda: self._move_grid(-1),
+            (GRID, RIGHT): lambda: self._move_grid(1),
+            (GRID, UP): self._grid_up,
+            (GRID, DOWN): lambda: self._move_grid(self.grid.cols),
+            (GRID, ACCEPT): lambda: self.grid.press(self.index),
+            (GRID, FAVORITE): lambda: self.grid.toggle_favorite(self.index),
+            (GRID, PAGE_UP): lambda: self._move_grid(-self._page_step()),
+            (GRID, PAGE_DOWN): lambda: self._move_grid(self._page_step()),
+            (GRID, PREV_LETTER): lambda: self._jump_letter(-1),
+            (GRID, NEXT_LETTER): lambda: self._jump_letter(1),
+        }
+
+    # --- Raw events -> commands ---
+
+    def on_key_down(self, window, keycode, scancode, codepoint, modifiers):
+        key_name = keycode[1] if isinstance(keycode, tuple) else keycode
+        command = KEY_COMMANDS.get(key_name)
+        if command is None:
+            return False
+        self.dispatch(command)
+        return True
+
+    def on_joy_button_down(self, window, stickid, button):
+        hud = self.app.hud
+        pulse = {
+            0: hud.a_label,
+            1: hud.b_label,
+            2: hud.x_label,
+            3: hud.y_label,
+            4: self.app.tab_bar.children[-1],  # LB icon (Kivy lists children right to left)
+            5: self.app.tab_bar.children[0],   # RB icon
+        }.get(button)
+        if pulse is not None:
+            hud.pulse_button(pulse)
+
+        command = BUTTON_COMMANDS.get(button)
+        if command is not None:
+            self._press(("button", button), command)
+
+    def on_joy_button_up(self, window, stickid, button):
+        self._release(("button", button))
+
+    def on_joy_hat(self, window, stickid, hatid, value):
+        command = HAT_COMMANDS.get(tuple(value))
+        if command is None:
+            self._release(("hat", hatid))  # centred (or a diagonal)
+        else:
+            self._press(("hat", hatid), command)
+
+    def on_joy_axis(self, window, stickid, axisid, value):
+        value /= AXIS_MAX
+        source = ("axis", axisid)
+
+        if axisid in TRIGGER_COMMANDS:
+            if value > TRIGGER_THRESHOLD:
+                self._press(source, TRIGGER_COMMANDS[axisid])
+            else:
+                self._release(source)
+            return
+        if axisid not in STICK_COMMANDS:
+            return
+
+        if abs(value) < self.deadzone:
+            self._release(source)
+        else:
+            negative, positive = STICK_COMMANDS[axisid]
+            self._press(source, positive if value > 0 else negative)
+
+    # --- Auto-repeat ---
+
+    def _press(self, source, command):
+        # Fires once now; a held direction then repeats after REPEAT_DELAY, speeding up as it goes
+        if self._held == (source, command):
+            return  # axes report every small movement; only a new direction counts as a press
+        self._stop_repeat()
+        self.dispatch(command)
+        if command in REPEATABLE:
+            self._held = (source, command)
+            self._repeat_interval = REPEAT_INTERVAL
+            self._repeat_event = Clock.schedule_once(self._repeat, REPEAT_DELAY)
+
+    def _release(self, source):
+        if self._held is not None and self._held[0] == source:
+            self._stop_repeat()
+
+    def _stop_repeat(self):
+        if self._repeat_event is not None:
+            self._repeat_event.cancel()
+        self._repeat_event = None
+        self._held = None
+
+    def _repeat(self, dt):
+        if self._held is None:
+            return
+        self.dispatch(self._held[1])
+        self._repeat_event = Clock.schedule_once(self._repeat, self._repeat_interval)
+        self._repeat_interval = max(REPEAT_MIN_INTERVAL, self._repeat_interval * REPEAT_ACCELERATION)
+
+    def cancel_repeat(self):
+        # Input is being handed to an emulator; a held stick must not keep scrolling behind it
+        self._stop_repeat()
+
+    # --- Focus state machine ---
+
+    def dispatch(self, command):
+        if command == PREV_TAB:
+            return self._cycle_tab(-1)
+        if command == NEXT_TAB:
+            return self._cycle_tab(1)
+
+        if self.mode == GRID and not (self.grid is not None and self.grid.data):
+            return
+        handler = self._handlers.get((self.mode, command))
+        if handler is not None:
+            handler()
+
+    def enter_screen(self, platform):
+        """
+        Called when a tab's screen is shown: focus returns to the tab bar and the
+        screen's grid (if it has one) becomes the one a DOWN moves into.
+        """
+        if self.grid is not None:
+            self.grid.clear_focus()
+        screen = self.app.sm.get_screen(platform)
+        self.grid = getattr(screen, "grid", None)
+        self.index = 0
+        self._to_tabs()
+        self.highlight_tab(self.app.tab_order.index(platform))
+
+    def highlight_tab(self, tab_index):
+        self.tab_index = tab_index
+        tag = self.app.tab_order[tab_index]
+        if self._lit_tab is not None and self._lit_tab in self.app.tab_buttons:
+            self.app.tab_buttons[self._lit_tab].highlight(False)
+        self.app.tab_buttons[tag].highlight(True)
+        self._lit_tab = tag
+
+    def tab_inserted(self, position):
+        # Keep the highlighted tab the same when a platform tab is added before it
+        if position <= self.tab_index:
+            self.tab_index += 1
+
+    def clamp(self):
+        # The grid changed under us (scan, library watcher); follow the focused tile if it
+        # moved, or keep focus on a tile that still exists
+        if self.grid is None:
+            return
+        if self.mode == GRID and self.grid.focused_index >= 0:
+            self.index = self.grid.focused_index
+            return
+        self.index = max(0, min(self.index, len(self.grid.data) - 1))
+        if self.mode == GRID and self.grid.data:
+            self.grid.focus(self.index)  # the focused game itself was removed
+
+    def _to_tabs(self):
+        self.mode = TAB
+        self.app.update_hud_context("tab")
+
+    def _move_tab(self, step):
+        self.highlight_tab((self.tab_index + step) % len(self.app.tab_order))
+        self.app.current_tab_index = self.tab_index
+
+    def _select_tab(self):
+        self.app.tab_buttons[self.app.tab_order[self.tab_index]].dispatch('on_release')
+
+    def _cycle_tab(self, step):
+        app = self.app
+        app.current_tab_index = (app.current_tab_index + step) % len(app.tab_order)
+        app.tab_buttons[app.tab_order[app.current_tab_index]].dispatch('on_release')
+
+    def _enter_grid(self):
+        if self.grid is None or not self.grid.data:
+            return
+        self.mode = GRID
+        self.index = 0
+        self._focus(0)
+        self.app.update_hud_context("grid")
+
+    def _grid_up(self):
+        if self.index < self.grid.cols:
+            # Top row -> back to the tab bar
+            self.grid.clear_focus()
+            self._to_tabs()
+            self.highlight_tab(self.tab_index)
+            return
+        self._move_grid(-self.grid.cols)
+
+    def _move_grid(self, step):
+        self._focus(min(len(self.grid.data) - 1, max(0, self.index + step)))
+
+    def _page_step(self):
+        # One screenful of rows
+        return self.grid.cols * self.grid.visible_rows()
+
+    def _jump_letter(self, direction):
+        # First tile of the next/previous run of titles starting with a different letter
+        starts = self.grid.letter_starts()
+        position = bisect_right(starts, self.index) - 1  # run containing the focused tile
+        if direction > 0:
+            if position + 1 < len(starts):
+                self._focus(starts[position + 1])
+        elif starts[position] < self.index:
+            self._focus(starts[position])  # back to the start of this letter first
+        elif position > 0:
+            self._focus(starts[position - 1])
+
+    def _focus(self, index):
+        self.index = index
+        self.grid.focus(index)
+        self.app.scroll_to_focused_game()
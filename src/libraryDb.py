@@ -0,0 +1,220 @@
+import sqlite3
+import threading
+import time
+
+from src.gameEntry import GameEntry
+from src.libraryIndex import INDEX_VERSION
+
+LIBRARY_DB_FILE = "library.db"
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    pass_key TEXT NOT NULL,          -- scan pass that produced the row, see romScanner.collect_passes
+    pass_position INTEGER NOT NULL,  -- index of that pass in collect_passes() order, across all platforms
+    position INTEGER NOT NULL,       -- order within the pass, so grids keep the scanner's order
+    platform TEXT NOT NULL,
+    title TEXT NOT NULL,
+    rom_path TEXT NOT NULL,
+    cover_path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_games_pass ON games (pass_key);
+CREATE INDEX IF NOT EXISTS idx_games_order ON games (pass_position, position);
+CREATE INDEX IF NOT EXISTS idx_games_rom ON games (platform, rom_path);
+CREATE TABLE IF NOT EXISTS pass_dirs (
+    pass_key TEXT NOT NULL,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER,                -- NULL if the directory didn't exist when the pass ran
+    PRIMARY KEY (pass_key, path)
+);
+CREATE TABLE IF NOT EXISTS index_version (
+    version INTEGER NOT NULL         -- libraryIndex.INDEX_VERSION the passes were scanned with
+);
+CREATE TABLE IF NOT EXISTS fingerprints (
+    rom_path TEXT PRIMARY KEY,
+    crc32 TEXT NOT NULL,
+    sha1 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS favorites (
+    platform TEXT NOT NULL,
+    rom_path TEXT NOT NULL,
+    title TEXT NOT NULL,
+    cover_path TEXT NOT NULL,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (platform, rom_path)
+);
+CREATE TABLE IF NOT EXISTS play_history (
+    id INTEGER PRIMARY KEY,
+    platform TEXT NOT NULL,
+    rom_path TEXT NOT NULL,
+    title TEXT NOT NULL,
+    cover_path TEXT NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_played ON play_history (played_at);
+CREATE INDEX IF NOT EXISTS idx_history_game ON play_history (platform, rom_path, played_at);
+"""
+
+GAME_COLUMNS = "platform, title, rom_path, cover_path"
+
+
+def _row_to_game(row):
+    return GameEntry(title=row[1], platform=row[0], rom_path=row[2], cover_path=row[3])
+
+
+class LibraryDatabase:
+    """
+    Optional SQLite catalog of the library: games, favorites and play history. When
+    enabled it replaces library_index.json: the scanner and library watcher write
+    each scan pass into it as the pass is re-walked, and startup loads the platform
+    lists back from it in scan order. The home screen reads favorites and recently
+    played games from it. Games come back as GameEntry records.
+    """
+
+    def __init__(self, path=LIBRARY_DB_FILE):
+        self.path = path
+        self._lock = threading.Lock()  # the scan thread, watcher thread and UI share one connection
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+    def _migrate(self):
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                # The catalog is rebuilt by the next scan, so an old layout is simply dropped.
+                # Favorites and play history have no other source, so they are kept.
+                for table in ("games", "pass_dirs", "covers", "platforms"):  # covers and platforms: schema 1 only
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self._conn.executescript(SCHEMA)
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+            # Same rule as library_index.json: passes from an older scanner are rescanned
+            row = self._conn.execute("SELECT version FROM index_version").fetchone()
+            if row is None or row[0] != INDEX_VERSION:
+                for table in ("games", "pass_dirs", "index_version"):
+                    self._conn.execute(f"DELETE FROM {table}")
+                self._conn.execute("INSERT INTO index_version (version) VALUES (?)", (INDEX_VERSION,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --- The library index: written by the scanner and watcher, loaded at startup ---
+
+    def load_index(self):
+        """
+        The scan passes in the same layout as libraryIndex.load_index(): {"passes":
+        {key: {"dirs", "games"}}}, each pass's games in scan order.
+        """
+        passes = {}
+        with self._lock:
+            for key, path, mtime_ns in self._conn.execute("SELECT pass_key, path, mtime_ns FROM pass_dirs"):
+                passes.setdefault(key, {"dirs": {}, "games": []})["dirs"][path] = mtime_ns
+            rows = self._conn.execute(
+                f"SELECT pass_key, {GAME_COLUMNS} FROM games ORDER BY pass_position, position"
+            )
+            for row in rows:
+                if row[0] in passes:
+                    passes[row[0]]["games"].append(_row_to_game(row[1:]))
+        return {"passes": passes}
+
+    def replace_pass(self, pass_key, pass_position, entry):
+        """
+        Replaces one scan pass (its directory mtimes and games) with its latest results.
+        """
+        rows = [
+            (pass_key, pass_position, position, game.platform, game.title, game.rom_path, game.cover_path)
+            for position, game in enumerate(entry["games"])
+        ]
+        paths = {game.rom_path for game in entry["games"]}
+        with self._lock, self._conn:
+            # Fingerprints follow the games: ROMs that were renamed or deleted lose theirs
+            gone = [(row[0],) for row in self._conn.execute("SELECT rom_path FROM games WHERE pass_key = ?", (pass_key,))
+                    if row[0] not in paths]
+            self._conn.executemany("DELETE FROM fingerprints WHERE rom_path = ?", gone)
+            self._conn.execute("DELETE FROM games WHERE pass_key = ?", (pass_key,))
+            self._conn.execute("DELETE FROM pass_dirs WHERE pass_key = ?", (pass_key,))
+            self._conn.executemany(
+                "INSERT INTO games (pass_key, pass_position, position, platform, title, rom_path, cover_path)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.executemany(
+                "INSERT INTO pass_dirs (pass_key, path, mtime_ns) VALUES (?, ?, ?)",
+                [(pass_key, path, mtime_ns) for path, mtime_ns in entry["dirs"].items()]
+            )
+
+    def remove_passes(self, pass_keys):
+        with self._lock, self._conn:
+            keys = [(key,) for key in pass_keys]
+            self._conn.executemany(
+                "DELETE FROM fingerprints WHERE rom_path IN (SELECT rom_path FROM games WHERE pass_key = ?)", keys
+            )
+            self._conn.executemany("DELETE FROM games WHERE pass_key = ?", keys)
+            self._conn.executemany("DELETE FROM pass_dirs WHERE pass_key = ?", keys)
+
+    def set_fingerprint(self, game_info, fingerprint):
+        # Skipped if the game was removed while it was being hashed
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fingerprints (rom_path, crc32, sha1)"
+                " SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM games WHERE platform = ? AND rom_path = ?)",
+                (game_info.rom_path, fingerprint["crc32"], fingerprint["sha1"], game_info.platform, game_info.rom_path)
+            )
+
+    # --- Favorites and play history ---
+
+    def set_favorite(self, game_info, favorited):
+        with self._lock, self._conn:
+            if favorited:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO favorites (platform, rom_path, title, cover_path, added_at) VALUES (?, ?, ?, ?, ?)",
+                    (game_info.platform, game_info.rom_path, game_info.title, game_info.cover_path, time.time())
+                )
+            else:
+                self._conn.execute(
+                    "DELETE FROM favorites WHERE platform = ? AND rom_path = ?",
+                    game_info.key
+                )
+
+    def import_favorites(self, games):
+        """
+        Seeds the favorites table from favorites.json the first time the catalog is used.
+        games is newest first, as stored by FavoritesStore.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            if self._conn.execute("SELECT 1 FROM favorites LIMIT 1").fetchone():
+                return
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO favorites (platform, rom_path, title, cover_path, added_at) VALUES (?, ?, ?, ?, ?)",
+                [(g.platform, g.rom_path, g.title, g.cover_path, now - i) for i, g in enumerate(games)]
+            )
+
+    def favorites(self):
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {GAME_COLUMNS} FROM favorites ORDER BY added_at DESC")
+            return [_row_to_game(row) for row in rows]
+
+    def record_play(self, game_info):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO play_history (platform, rom_path, title, cover_path, played_at) VALUES (?, ?, ?, ?, ?)",
+                (game_info.platform, game_info.rom_path, game_info.title, game_info.cover_path, time.time())
+            )
+
+    def recent(self, limit=5):
+        """
+        Most recently played games, each listed once.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {GAME_COLUMNS} FROM play_history h"
+                " WHERE played_at = (SELECT MAX(played_at) FROM play_history"
+                "                    WHERE platform = h.platform AND rom_path = h.rom_path)"
+                " ORDER BY played_at DESC LIMIT ?",
+                (limit,)
+            )
+            return [_row_to_game(row) for row in rows]
@@ -0,0 +1,57 @@
+import json
+import os
+
+from src.gameEntry import GameEntry, entries_from_json
+
+LIBRARY_INDEX_FILE = "library_index.json"
+INDEX_VERSION = 8
+
+
+def dir_mtime(path):
+    """
+    Returns the directory's modification time in nanoseconds, or None if it doesn't exist.
+    A directory's mtime changes whenever an entry is added, removed or renamed inside it.
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_index():
+    """
+    Loads the persisted library index. Returns an empty index if the file is
+    missing, corrupted or was written by an older version of the scanner.
+    """
+    if os.path.exists(LIBRARY_INDEX_FILE):
+        try:
+            with open(LIBRARY_INDEX_FILE, 'r') as f:
+                index = json.load(f)
+            if isinstance(index, dict) and index.get("version") == INDEX_VERSION:
+                for entry in index["passes"].values():
+                    entry["games"] = entries_from_json(entry.get("games"))
+                return index
+        except (json.JSONDecodeError, OSError):
+            print(f"Error: {LIBRARY_INDEX_FILE} is corrupted. Rebuilding.")
+    return {"version": INDEX_VERSION, "passes": {}}
+
+
+def save_index(index):
+    # Write to a temp file first so a crash mid-write never leaves a half-written index
+    tmp_path = LIBRARY_INDEX_FILE + ".tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f, default=GameEntry.to_dict)
+        os.replace(tmp_path, LIBRARY_INDEX_FILE)
+    except OSError as e:
+        print(f"[ERROR] Could not save library index: {e}")
+
+
+def is_fresh(entry):
+    """
+    Checks a cached scan pass against the filesystem. Only the directories the pass
+    listed are stat'ed, so a warm check costs one stat per directory instead of a walk.
+    """
+    if not entry or "dirs" not in entry:
+        return False
+    return all(dir_mtime(path) == mtime for path, mtime in entry["dirs"].items())
@@ -0,0 +1,245 @@
+import os
+import select
+import sys
+import threading
+
+from src.libraryIndex import dir_mtime, load_index, save_index, is_fresh
+from src.romScanner import collect_passes, run_pass, INSTALLED_PS3_PATH
+
+WATCH_INTERVAL = 2.0       # seconds between mtime checks when polling
+INOTIFY_SAFETY_POLL = 30.0  # still re-check every tracked directory this often, inotify or not
+
+# inotify event flags (see <sys/inotify.h>)
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF
+
+
+class _Inotify:
+    """
+    Minimal ctypes wrapper over Linux inotify. It is only used as a wake-up signal:
+    what actually changed is still worked out from directory mtimes.
+    """
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches = {}  # path -> watch descriptor
+
+    def sync(self, paths):
+        # Watch exactly the given directories, adding new ones and dropping vanished ones
+        paths = {p for p in paths if os.path.isdir(p)}
+        for path in list(self._watches):
+            if path not in paths:
+                self._rm_watch(self.fd, self._watches.pop(path))
+        for path in paths - set(self._watches):
+            wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+            if wd >= 0:
+                self._watches[path] = wd
+
+    def wait(self, timeout):
+        # Returns True if any event arrived; events are drained since only the wake-up matters
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            while os.read(self.fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+def _diff_games(old_games, new_games):
+    """
+    Compares two game lists from the same scan pass and returns deltas:
+    ("added", game), ("removed", game), ("renamed", old, new) and ("updated", old, new).
+    A ROM that disappeared while exactly one new ROM appeared in the same folder is
+    reported as a rename; a ROM whose title or cover changed is reported as updated.
+    """
+    old_by_path = {g.rom_path: g for g in old_games}
+    new_by_path = {g.rom_path: g for g in new_games}
+
+    deltas = []
+    for path, game in new_by_path.items():
+        old = old_by_path.get(path)
+        if old is not None and old != game:
+            deltas.append(("updated", old, game))
+
+    removed = [g for p, g in old_by_path.items() if p not in new_by_path]
+    added = [g for p, g in new_by_path.items() if p not in old_by_path]
+
+    def folder(game):
+        return os.path.dirname(game.rom_path)
+
+    for old in list(removed):
+        same_folder_removed = [g for g in removed if folder(g) == folder(old)]
+        same_folder_added = [g for g in added if folder(g) == folder(old)]
+        if len(same_folder_removed) == 1 and len(same_folder_added) == 1:
+            new = same_folder_added[0]
+            deltas.append(("renamed", old, new))
+            removed.remove(old)
+            added.remove(new)
+
+    deltas.extend(("removed", g) for g in removed)
+    deltas.extend(("added", g) for g in added)
+    return deltas
+
+
+class LibraryWatcher:
+    """
+    Keeps the library live while the launcher runs. Only scan passes whose
+    directories changed are re-run, and their results are diffed against the
+    previous games, so the library is never fully rescanned. Uses inotify on
+    Linux and falls back to polling directory mtimes elsewhere.
+
+    on_changes(deltas) is called from the watcher thread with the list produced by
+    _diff_games; callers on a UI toolkit should hop back to their main thread.
+    """
+
+    def __init__(self, rom_base_dir, cover_base_dir, on_changes, interval=WATCH_INTERVAL, use_inotify=True, db=None):
+        self.rom_base_dir = rom_base_dir
+        self.cover_base_dir = cover_base_dir
+        self.db = db
+        self.on_changes = on_changes
+        self.interval = interval
+        self.use_inotify = use_inotify
+        self._stop = threading.Event()
+        self._thread = None
+        self._entries = {}
+        self._inotify = None
+        self._roots = None  # platform root mtimes seen by the last poll
+
+    def start(self):
+        # Picks up where the startup scan left off, using the index (or catalog) it just saved
+        index = self.db.load_index() if self.db is not None else load_index()
+        self._entries = dict(index["passes"])
+
+        if self.use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                print(f"[WARN] inotify unavailable, polling for library changes: {e}")
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _watched_dirs(self):
+        dirs = {self.rom_base_dir, self.cover_base_dir, INSTALLED_PS3_PATH}
+        for entry in self._entries.values():
+            dirs.update(entry["dirs"])
+        return dirs
+
+    def _root_mtimes(self):
+        """
+        mtimes of the ROM and cover folders and each platform folder directly under them.
+        Adding, removing or renaming a ROM, game folder or cover changes one of these;
+        changes deeper inside a game folder are picked up by the periodic full check.
+        """
+        roots = {INSTALLED_PS3_PATH: dir_mtime(INSTALLED_PS3_PATH)}
+        for base in (self.rom_base_dir, self.cover_base_dir):
+            roots[base] = dir_mtime(base)
+            try:
+                names = os.listdir(base)
+            except OSError:
+                continue
+            for name in names:
+                path = os.path.join(base, name)
+                roots[path] = dir_mtime(path)
+        return roots
+
+    def _run(self):
+        since_full_check = 0.0
+        self._roots = self._root_mtimes()
+        try:
+            while not self._stop.is_set():
+                if self._inotify is not None:
+                    self._inotify.sync(self._watched_dirs())
+                    # Wake up in short slices so stop() is honoured promptly
+                    waited = 0.0
+                    while waited < INOTIFY_SAFETY_POLL and not self._stop.is_set():
+                        if self._inotify.wait(1.0):
+                            # Let a burst of events (e.g. a copy in progress) settle first
+                            self._stop.wait(self.interval)
+                            break
+                        waited += 1.0
+                else:
+                    # Polling: a cheap look at the platform roots decides whether to go deeper
+                    self._stop.wait(self.interval)
+                    since_full_check += self.interval
+                    roots = self._root_mtimes()
+                    if roots == self._roots and since_full_check < INOTIFY_SAFETY_POLL:
+                        continue
+                    self._roots = roots
+                    since_full_check = 0.0
+
+                if not self._stop.is_set():
+                    try:
+                        self.check()
+                    except OSError as e:
+                        # A folder vanished mid-scan or a drive dropped out; try again next time
+                        print(f"[ERROR] Library watcher check failed: {e}")
+        finally:
+            if self._inotify is not None:
+                self._inotify.close()
+
+    def check(self):
+        """
+        Re-runs the scan passes whose directories changed and reports the differences.
+        """
+        passes = collect_passes(self.rom_base_dir, self.cover_base_dir)
+        keys = set()
+        deltas = []
+
+        for position, (key, platform, scan_fn, args) in enumerate(passes):
+            keys.add(key)
+            entry = self._entries.get(key)
+            if is_fresh(entry):
+                continue
+
+            new_entry, rescanned = run_pass(entry, scan_fn, args)
+            if not rescanned:
+                continue  # the pass failed; what it found last time stands
+            deltas.extend(_diff_games(entry["games"] if entry else [], new_entry["games"]))
+            self._entries[key] = new_entry
+            if self.db is not None:
+                self.db.replace_pass(key, position, new_entry)
+
+        # Platform folders that were deleted take all their games with them
+        vanished = [k for k in self._entries if k not in keys]
+        for key in vanished:
+            deltas.extend(("removed", g) for g in self._entries.pop(key)["games"])
+        if vanished and self.db is not None:
+            self.db.remove_passes(vanished)
+
+        if not deltas:
+            return
+
+        if self.db is None:
+            index = load_index()
+            index["passes"] = dict(self._entries)
+            save_index(index)
+
+        self.on_changes(deltas)
@@ -0,0 +1,79 @@
+import os
+import struct
+import threading
+
+SFO_MAGIC = b"\x00PSF"
+SFO_HEADER = struct.Struct("<4sIIII")        # magic, version, key table, data table, entry count
+SFO_INDEX_ENTRY = struct.Struct("<HHIII")    # key offset, data format, length, max length, data offset
+
+FMT_UTF8_SPECIAL = 0x0004  # UTF-8 without a NUL terminator
+FMT_UTF8 = 0x0204          # NUL-terminated UTF-8
+FMT_INT32 = 0x0404
+
+SFO_FIELDS = ("TITLE", "TITLE_ID", "CATEGORY", "VERSION")
+MAX_INDEX_ENTRIES = 256    # real files have a few dozen; anything larger is corrupt
+
+_cache = {}  # (abspath, fields) -> (mtime_ns, values)
+_cache_lock = threading.Lock()
+
+
+def _decode(fmt, raw):
+    if fmt == FMT_INT32:
+        return struct.unpack("<i", raw[:4])[0] if len(raw) >= 4 else None
+    return raw.split(b"\x00", 1)[0].decode("utf-8", errors="replace")
+
+
+def _parse(f, fields):
+    header = f.read(SFO_HEADER.size)
+    if len(header) < SFO_HEADER.size:
+        return {}
+    magic, _, key_table, data_table, count = SFO_HEADER.unpack(header)
+    if magic != SFO_MAGIC or count > MAX_INDEX_ENTRIES or key_table > data_table:
+        return {}
+
+    # Index and key tables are contiguous and small; the data table is only touched per wanted key
+    index = f.read(count * SFO_INDEX_ENTRY.size)
+    f.seek(key_table)
+    keys = f.read(data_table - key_table)
+
+    values = {}
+    for i in range(min(count, len(index) // SFO_INDEX_ENTRY.size)):
+        key_offset, fmt, length, _, data_offset = SFO_INDEX_ENTRY.unpack_from(index, i * SFO_INDEX_ENTRY.size)
+        key = keys[key_offset:keys.find(b"\x00", key_offset)].decode("ascii", errors="replace")
+        if key not in fields:
+            continue
+        f.seek(data_table + data_offset)
+        values[key] = _decode(fmt, f.read(length))
+        if len(values) == len(fields):
+            break
+    return values
+
+
+def read_sfo(sfo_path, fields=SFO_FIELDS):
+    """
+    Parses a PS3/PSP/Vita PARAM.SFO and returns the requested fields that are present,
+    e.g. {"TITLE": "LittleBigPlanet", "TITLE_ID": "BCUS98148", "CATEGORY": "HG", "VERSION": "01.00"}.
+    Returns {} if the file is missing or isn't an SFO. Results are cached until the
+    file's mtime changes.
+    """
+    try:
+        mtime_ns = os.stat(sfo_path).st_mtime_ns
+    except OSError:
+        return {}
+    key = (os.path.abspath(sfo_path), tuple(fields))
+
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        values = cached[1]
+    else:
+        try:
+            with open(sfo_path, 'rb') as f:
+                values = _parse(f, set(fields))
+        except OSError as e:
+            print(f"Error parsing {sfo_path}: {e}")
+            values = {}
+        with _cache_lock:
+            _cache[key] = (mtime_ns, values)
+
+    return dict(values)
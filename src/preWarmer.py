@@ -0,0 +1,135 @@
+import os
+import threading
+from functools import partial
+
+from kivy.clock import Clock
+
+from src.emulatorRegistry import get_registry
+
+BUNDLED_EMULATORS_DIR = "Emulators"
+DEFAULT_DWELL = 1.0     # seconds a tile must stay focused before anything is read
+DEFAULT_ROM_MB = 64     # how much of the start of a ROM is read ahead
+EMULATOR_DIR_MB = 256   # cap on emulator binaries/libraries read ahead
+READ_CHUNK = 1024 * 1024
+EMULATOR_EXTENSIONS = {".exe", ".dll", ".so", ".dylib", ".pak", ".dat", ""}
+
+
+def _emulator_files(emulator_path):
+    # The executable first, then the libraries and data files next to it that it loads at startup.
+    # Only bundled emulators have a folder of their own; one found on PATH sits in e.g. /usr/bin.
+    emulator_path = os.path.abspath(emulator_path)
+    emu_dir = os.path.dirname(emulator_path)
+    yield emulator_path
+    bundled = os.path.abspath(BUNDLED_EMULATORS_DIR)
+    if not emu_dir.startswith(bundled + os.sep):
+        return
+    try:
+        names = sorted(os.listdir(emu_dir))
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(emu_dir, name)
+        if path == emulator_path:
+            continue
+        if os.path.splitext(name)[1].lower() in EMULATOR_EXTENSIONS and os.path.isfile(path):
+            yield path
+
+
+def _rom_files(rom_path):
+    # Folder games (Wii U, installed PS3 titles) are warmed file by file in directory order
+    if os.path.isfile(rom_path):
+        yield rom_path
+        return
+    for root, dirs, files in os.walk(rom_path):
+        dirs.sort()
+        for name in sorted(files):
+            yield os.path.join(root, name)
+
+
+class PreWarmer:
+    """
+    Reads the focused game's emulator and the start of its ROM into the OS page cache
+    once its tile has been focused for a short dwell, so the cold first reads after
+    launch (often off slow USB storage) hit memory instead. Only one game is warmed at
+    a time; focusing another tile cancels the pending or running read-ahead.
+    The dwell runs on the Kivy clock and the reads on one long-lived worker thread.
+    """
+
+    def __init__(self, dwell=DEFAULT_DWELL, rom_mb=DEFAULT_ROM_MB):
+        self.dwell = dwell
+        self.rom_bytes = int(rom_mb * 1024 * 1024)
+        self._cond = threading.Condition()
+        self._dwell_event = None  # main thread only
+        self._job = None          # (platform, rom_path, cancel) waiting for the worker
+        self._cancel = None       # Event of the queued or running read-ahead
+        self._warmed = set()      # (platform, rom_path) and emulator executables fully read ahead
+        threading.Thread(target=self._work, daemon=True).start()
+
+    def focus(self, platform, rom_path):
+        """
+        Called on the main thread whenever a tile gains focus; starts the dwell for that game.
+        """
+        self.cancel()
+        self._dwell_event = Clock.schedule_once(partial(self._start, platform, os.path.abspath(rom_path)), self.dwell)
+
+    def cancel(self):
+        if self._dwell_event is not None:
+            self._dwell_event.cancel()
+            self._dwell_event = None
+        with self._cond:
+            if self._cancel is not None:
+                self._cancel.set()
+            self._job = self._cancel = None
+
+    def is_warm(self, platform, rom_path):
+        with self._cond:
+            return (platform, os.path.abspath(rom_path)) in self._warmed
+
+    def _start(self, platform, rom_path, dt):
+        # The tile is still focused after the dwell: hand it to the worker
+        self._dwell_event = None
+        with self._cond:
+            self._cancel = threading.Event()
+            self._job = (platform, rom_path, self._cancel)
+            self._cond.notify()
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while self._job is None:
+                    self._cond.wait()
+                job, self._job = self._job, None
+            self._warm(*job)
+
+    def _warm(self, platform, rom_path, cancel):
+        emulator = get_registry().get(platform)
+        if emulator is not None:
+            with self._cond:
+                emulator_warm = emulator.executable in self._warmed
+            if not emulator_warm:
+                self._read_ahead(_emulator_files(emulator.executable), EMULATOR_DIR_MB * 1024 * 1024, cancel)
+                if not cancel.is_set():
+                    with self._cond:
+                        self._warmed.add(emulator.executable)
+        self._read_ahead(_rom_files(rom_path), self.rom_bytes, cancel)
+
+        if not cancel.is_set():
+            with self._cond:
+                self._warmed.add((platform, rom_path))
+
+    def _read_ahead(self, paths, budget, cancel):
+        # Plain reads rather than fadvise so it works the same on Windows; the data is discarded
+        for path in paths:
+            try:
+                with open(path, 'rb', buffering=0) as f:
+                    while budget > 0:
+                        if cancel.is_set():
+                            return
+                        chunk = f.read(min(READ_CHUNK, budget))
+                        if not chunk:
+                            break
+                        budget -= len(chunk)
+            except OSError:
+                continue
+            if budget <= 0:
+                return
@@ -0,0 +1,234 @@
+import hashlib
+import json
+import mmap
+import os
+import threading
+import zlib
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+
+HASH_CACHE_FILE = os.path.join("cache", "rom_hashes.json")
+CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_HASH_WORKERS = 2
+
+INES_MAGIC = b"NES\x1a"
+INES_HEADER_SIZE = 16
+COPIER_HEADER_SIZE = 512  # added by SNES copier devices, not part of the ROM
+
+
+def _header_size(path, size, magic):
+    """
+    Bytes to skip before hashing so the fingerprint matches No-Intro style databases,
+    which hash the ROM data without dumper/emulator headers.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".nes" and magic.startswith(INES_MAGIC):
+        return INES_HEADER_SIZE
+    if ext in (".smc", ".sfc") and size % 1024 == COPIER_HEADER_SIZE:
+        return COPIER_HEADER_SIZE
+    return 0
+
+
+def hash_rom(path):
+    """
+    Returns {"crc32": ..., "sha1": ...} (lowercase hex) of the ROM's contents, minus any
+    .nes/.smc header. The file is memory-mapped and hashed in CHUNK_SIZE slices, so
+    multi-GB disc images are never read into memory at once.
+    """
+    crc = 0
+    sha1 = hashlib.sha1()
+
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > 0:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mapped = None
+
+            if mapped is not None:
+                with mapped, memoryview(mapped) as view:
+                    for offset in range(_header_size(path, size, mapped[:4]), size, CHUNK_SIZE):
+                        with view[offset:offset + CHUNK_SIZE] as chunk:
+                            crc = zlib.crc32(chunk, crc)
+                            sha1.update(chunk)
+            else:
+                # Some filesystems (e.g. network shares) can't be mapped; stream the file instead
+                f.seek(_header_size(path, size, f.read(4)))
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    crc = zlib.crc32(chunk, crc)
+                    sha1.update(chunk)
+
+    return {"crc32": f"{crc:08x}", "sha1": sha1.hexdigest()}
+
+
+def _file_signature(path):
+    # (size, mtime_ns) is what decides whether a cached fingerprint still applies
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class RomHashCache:
+    """
+    Fingerprints already computed, keyed by absolute path and validated against the
+    file's size and mtime, so each ROM is hashed once unless it is replaced.
+    """
+
+    def __init__(self, path=HASH_CACHE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self._entries = entries
+        except (json.JSONDecodeError, OSError):
+            print(f"Error: {self.path} is corrupted. ROMs will be hashed again.")
+
+    def get(self, rom_path, signature=None):
+        """
+        Returns the cached fingerprint for rom_path, or None if it's missing or stale.
+        """
+        signature = signature or _file_signature(rom_path)
+        if signature is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(rom_path))
+        if not entry or (entry.get("size"), entry.get("mtime_ns")) != signature:
+            return None
+        return {"crc32": entry["crc32"], "sha1": entry["sha1"]}
+
+    def move(self, old_path, new_path):
+        # A rename keeps the file's size and mtime, so its fingerprint still validates
+        with self._lock:
+            entry = self._entries.pop(os.path.abspath(old_path), None)
+            if entry is not None:
+                self._entries[os.path.abspath(new_path)] = entry
+                self._dirty = True
+
+    def put(self, rom_path, signature, fingerprint):
+        with self._lock:
+            self._entries[os.path.abspath(rom_path)] = {
+                "size": signature[0], "mtime_ns": signature[1], **fingerprint
+            }
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = dict(self._entries)
+            self._dirty = False
+
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[ERROR] Could not save ROM hash cache: {e}")
+
+
+class RomHasher:
+    """
+    Fingerprints ROMs in a background thread pool; hashlib and zlib release the GIL
+    while hashing large buffers, so the workers run in parallel. submit() returns
+    immediately; on_hashed(game, fingerprint) is called from a helper thread as each
+    file finishes (cached files are reported straight away), and the cache is saved
+    after each batch.
+    """
+
+    def __init__(self, workers=DEFAULT_HASH_WORKERS, cache=None):
+        self.workers = workers
+        self.cache = cache or RomHashCache()
+        self._pool = None
+        self._pending = set()  # rom paths queued or being hashed
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, games, on_hashed=None):
+        with self._lock:
+            games = [game for game in games if game.rom_path not in self._pending]
+            self._pending.update(game.rom_path for game in games)
+        if games:
+            threading.Thread(target=self._run, args=(games, on_hashed), daemon=True).start()
+
+    def renamed(self, old_game, new_game, on_hashed=None):
+        """
+        Carries old_game's fingerprint over to new_game's path so a renamed ROM isn't
+        hashed again, then reports it like submit() does.
+        """
+        self.cache.move(old_game.rom_path, new_game.rom_path)
+        self.submit([new_game], on_hashed)
+
+    def _finish(self, game):
+        with self._lock:
+            self._pending.discard(game.rom_path)
+
+    def _run(self, games, on_hashed):
+        # Stats happen here rather than in submit(), which is called from the UI thread
+        jobs = []
+        for game in games:
+            signature = _file_signature(game.rom_path)
+            fingerprint = self.cache.get(game.rom_path, signature) if signature is not None else None
+            if signature is None or fingerprint is not None:
+                self._finish(game)
+                if fingerprint is not None and on_hashed:
+                    on_hashed(game, fingerprint)
+                continue
+            jobs.append((game, signature))
+        if not jobs:
+            return
+
+        with self._lock:
+            if self._closed:
+                self._pending.difference_update(game.rom_path for game, _ in jobs)
+                return
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+            pool = self._pool
+
+        try:
+            futures = {pool.submit(hash_rom, game.rom_path): (game, signature) for game, signature in jobs}
+        except RuntimeError:
+            # Shut down while the batch was being queued
+            with self._lock:
+                self._pending.difference_update(game.rom_path for game, _ in jobs)
+            return
+
+        for future in as_completed(futures):
+            game, signature = futures[future]
+            self._finish(game)
+            try:
+                fingerprint = future.result()
+            except CancelledError:
+                continue
+            except Exception as e:
+                print(f"[ERROR] Could not hash {game.rom_path}: {e}")
+                continue
+
+            # A file that changed while being hashed is left for the next submit
+            if _file_signature(game.rom_path) == signature:
+                self.cache.put(game.rom_path, signature, fingerprint)
+                if on_hashed:
+                    on_hashed(game, fingerprint)
+
+        self.cache.save()
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self.cache.save()
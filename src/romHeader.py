@@ -0,0 +1,117 @@
+import os
+import threading
+
+HEADER_READ_SIZE = 512
+
+GAMECUBE_MAGIC = b"\xc2\x33\x9f\x3d"  # at 0x1C of a GameCube disc header
+WII_MAGIC = b"\x5d\x1c\x9e\xa3"       # at 0x18 of a Wii disc header
+WBFS_MAGIC = b"WBFS"
+RVZ_MAGIC = b"RVZ\x01"
+WIA_MAGIC = b"WIA\x01"
+RVZ_DISC_HEADER_OFFSET = 0x58         # disc header copy inside the RVZ/WIA file header
+N64_ID_OFFSET = 0x3B
+N64_BYTE_ORDERS = {
+    b"\x80\x37\x12\x40": None,         # .z64, native big-endian
+    b"\x37\x80\x40\x12": 2,            # .v64, byte-swapped in 16-bit words
+    b"\x40\x12\x37\x80": 4,            # .n64, little-endian 32-bit words
+}
+GBA_ID_OFFSET = 0xAC
+GBA_FIXED_OFFSET = 0xB2               # always 0x96 in a valid cartridge header
+
+DISC_EXTENSIONS = {".iso", ".gcm", ".gcn"}
+N64_EXTENSIONS = {".z64", ".n64", ".v64"}
+
+_cache = {}  # abspath -> ((size, mtime_ns), game ID or None)
+_cache_lock = threading.Lock()
+
+
+def _valid_id(raw, length):
+    try:
+        text = raw[:length].decode("ascii")
+    except UnicodeDecodeError:
+        return None
+    return text if len(text) == length and text.isalnum() else None
+
+
+def _disc_id(header):
+    # GameCube/Wii disc header: 6-character ID at 0x0, confirmed by the console's magic word
+    if header[0x18:0x1C] == WII_MAGIC or header[0x1C:0x20] == GAMECUBE_MAGIC:
+        return _valid_id(header, 6)
+    return None
+
+
+def _wbfs_id(f, header):
+    # The first disc slot lives one HD sector in; its first bytes are a copy of the disc header
+    if len(header) < 9:
+        return None
+    sector_size = 1 << header[8]
+    if sector_size + 0x20 <= len(header):
+        return _disc_id(header[sector_size:])
+    f.seek(sector_size)
+    return _disc_id(f.read(0x20))
+
+
+def _n64_id(header):
+    swap = N64_BYTE_ORDERS.get(header[:4], False)
+    if swap is False:
+        return None
+    data = header[:0x40]
+    if swap:
+        # Undo the dump's byte order so the ID reads left to right
+        data = b"".join(data[i:i + swap][::-1] for i in range(0, len(data), swap))
+    return _valid_id(data[N64_ID_OFFSET:], 4)
+
+
+def _gba_id(header):
+    if len(header) <= GBA_FIXED_OFFSET or header[GBA_FIXED_OFFSET] != 0x96:
+        return None
+    return _valid_id(header[GBA_ID_OFFSET:], 4)
+
+
+def _read_id(path, ext):
+    with open(path, 'rb') as f:
+        header = f.read(HEADER_READ_SIZE)
+        if ext == ".wbfs" and header.startswith(WBFS_MAGIC):
+            return _wbfs_id(f, header)
+    if ext == ".rvz" and header[:4] in (RVZ_MAGIC, WIA_MAGIC):
+        return _disc_id(header[RVZ_DISC_HEADER_OFFSET:])
+    if ext in DISC_EXTENSIONS:
+        return _disc_id(header)
+    if ext in N64_EXTENSIONS:
+        return _n64_id(header)
+    if ext == ".gba":
+        return _gba_id(header)
+    return None
+
+
+def read_game_id(rom_path):
+    """
+    Returns the game ID stored in a GameCube/Wii (ISO, WBFS, RVZ), N64 or GBA header,
+    e.g. "SOUE01" or "NSME", or None if the file isn't one of those or has no valid ID.
+    Reads one HEADER_READ_SIZE block (plus one small seek for WBFS), and the result is
+    cached per file until its size or mtime changes.
+    """
+    ext = os.path.splitext(rom_path)[1].lower()
+    if ext not in DISC_EXTENSIONS | N64_EXTENSIONS | {".wbfs", ".rvz", ".gba"}:
+        return None
+
+    try:
+        st = os.stat(rom_path)
+    except OSError:
+        return None
+    key = os.path.abspath(rom_path)
+    signature = (st.st_size, st.st_mtime_ns)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        game_id = _read_id(rom_path, ext)
+    except OSError:
+        game_id = None
+
+    with _cache_lock:
+        _cache[key] = (signature, game_id)
+    return game_id
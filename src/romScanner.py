@@ -1,234 +1,471 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from src.utils import clean_title
+from src.libraryIndex import dir_mtime, load_index, save_index, is_fresh
+from src.gameEntry import GameEntry, DEFAULT_COVER
+from src.romHeader import read_game_id
+from src.paramSfo import read_sfo
+from src.titleMetadata import get_title_metadata, WIIU_TITLE_ID
 
 SUPPORTED_EXTENSIONS = {
     '.iso', '.bin', '.img', '.n64', '.smc', '.gba', '.gcn', '.cue', '.elf', '.rpx', '.rvz', '.nes', '.z64', '.sfc', '.gbc'
 }
 
-def scan_roms(rom_base_dir, cover_base_dir):
+INSTALLED_PS3_PATH = os.path.join("Emulators", "RPCS3", "dev_hdd0", "game")
+DEFAULT_SCAN_WORKERS = 4
+
+
+def _track(path, dirs):
+    # Remember the directory's mtime (None if missing) so the pass can be revalidated later
+    dirs[path] = dir_mtime(path)
+
+
+def _listdir(path, dirs):
+    # Record the mtime before listing: if the folder changes mid-scan, the next startup rescans it
+    _track(path, dirs)
+    return os.listdir(path)
+
+
+class CoverIndex:
+    """
+    Lookup tables for one platform's cover folder, built from a single listdir so
+    every ROM resolves its cover with dictionary lookups instead of re-listing the folder.
+    """
+
+    def __init__(self, cover_path):
+        self.cover_path = cover_path
+        self.dirs = {}      # the cover folder's mtime when it was listed
+        # Keyed case-insensitively, like the os.path.exists lookups on Windows this replaced
+        self.by_stem = {}   # "super mario world (usa)" -> {".jpg": "Super Mario World (USA).jpg"}
+        self.by_id = {}     # "SOUE01" -> {".png": "SOUE01.png"}
+        self.by_clean = {}  # clean_title(stem) -> first matching filename
+
+        if os.path.isdir(cover_path):
+            files = sorted(_listdir(cover_path, self.dirs))
+        else:
+            _track(cover_path, self.dirs)
+            files = []
+
+        for cover_file in files:
+            stem, ext = os.path.splitext(cover_file)
+            ext = ext.lower()
+            self.by_stem.setdefault(stem.casefold(), {}).setdefault(ext, cover_file)
+            self.by_clean.setdefault(clean_title(stem), cover_file)
+
+            game_id = _extract_game_id(stem)
+            if game_id:
+                self.by_id.setdefault(game_id.upper(), {}).setdefault(ext, cover_file)
+
+    def _pick(self, variants, exts):
+        for ext in exts:
+            if ext in variants:
+                return os.path.join(self.cover_path, variants[ext])
+        return None
+
+    def exact(self, stem, exts):
+        # Cover named exactly like the ROM/folder, trying extensions in order
+        return self._pick(self.by_stem.get(stem.casefold(), {}), exts)
+
+    def game_id(self, game_id, exts=('.png', '.jpg')):
+        if not game_id:
+            return None
+        return self._pick(self.by_id.get(game_id.upper(), {}), exts)
+
+    def fuzzy(self, title):
+        # Cover whose clean_title matches, e.g. "Mario Kart (USA).png" for "mario_kart"
+        cover_file = self.by_clean.get(clean_title(title))
+        return os.path.join(self.cover_path, cover_file) if cover_file else None
+
+
+class PlatformCovers:
+    """
+    One platform's CoverIndex, shared by all of its scan passes (e.g. the Wii U folder
+    pass and the flat-file pass) and built the first time one of them needs it, so
+    passes served from the index never list the cover folder at all.
+    """
+
+    def __init__(self, cover_path):
+        self.cover_path = cover_path
+        self._index = None
+        self._lock = threading.Lock()  # passes of one platform may run on different scan threads
+
+    def get(self, dirs):
+        # Each pass that uses the covers is revalidated against the cover folder too
+        with self._lock:
+            if self._index is None:
+                self._index = CoverIndex(self.cover_path)
+        dirs.update(self._index.dirs)
+        return self._index
+
+
+def _extract_game_id(name):
+    # "Game Title [GAMEID]", a bare 6-character disc ID like "SOUE01",
+    # or a 4-character N64/GBA cartridge code like "AXVE"
+    if '[' in name and ']' in name:
+        return name.split('[')[-1].split(']')[0]
+    if len(name) in (4, 6) and name.isalnum():
+        return name
+    return ""
+
+
+def _scan_installed_ps3(platform_covers, dirs):
     game_list = []
 
     # --- Scan dev_hdd0 for installed PS3 games ---
-    installed_ps3_path = os.path.join("Emulators", "RPCS3", "dev_hdd0", "game")
-    ps3_cover_path = os.path.join(cover_base_dir, "PS3")
+    covers = platform_covers.get(dirs)
 
-    if os.path.exists(installed_ps3_path):
-        for game_id in os.listdir(installed_ps3_path):
-            game_folder = os.path.join(installed_ps3_path, game_id)
+    if os.path.exists(INSTALLED_PS3_PATH):
+        for game_id in _listdir(INSTALLED_PS3_PATH, dirs):
+            game_folder = os.path.join(INSTALLED_PS3_PATH, game_id)
             eboot_path = os.path.join(game_folder, "USRDIR", "EBOOT.BIN")
+            sfo_path = os.path.join(game_folder, "PARAM.SFO")
+            _track(os.path.join(game_folder, "USRDIR"), dirs)
+            # The title comes from PARAM.SFO: the folder's mtime covers it being replaced,
+            # the file's own mtime covers it being rewritten in place (e.g. by an update)
+            _track(game_folder, dirs)
+            _track(sfo_path, dirs)
 
             if os.path.exists(eboot_path):
-                cover_img = os.path.join(ps3_cover_path, f"{game_id}.jpg")
-                if not os.path.exists(cover_img):
-                    cover_img = os.path.join("assets", "default_cover.png")
+                cover_img = covers.exact(game_id, ['.jpg']) or DEFAULT_COVER
 
-                game_list.append({
-                    "platform": "PS3",
-                    "title": game_id,
-                    "rom_path": eboot_path,
-                    "cover_path": cover_img
-                })
+                # Real name from PARAM.SFO, then the PS3 title database, then the title ID folder name
+                sfo = read_sfo(sfo_path)
+                title = sfo.get("TITLE") or get_title_metadata().name(game_id) or game_id
 
-    # --- Scan ROMs/ folders ---
-    for platform in os.listdir(rom_base_dir):
-        platform_path = os.path.join(rom_base_dir, platform)
-        cover_path = os.path.join(cover_base_dir, platform)
+                game_list.append(GameEntry(
+                    title=title,
+                    platform="PS3",
+                    rom_path=eboot_path,
+                    cover_path=cover_img
+                ))
+    else:
+        _track(INSTALLED_PS3_PATH, dirs)
 
-        if not os.path.isdir(platform_path):
+    return game_list
+
+
+def _scan_wiiu(platform, platform_path, platform_covers, dirs):
+    game_list = []
+    covers = platform_covers.get(dirs)
+
+    # --- Wii U RPX folder detection ---
+    for game_folder in _listdir(platform_path, dirs):
+        game_folder_path = os.path.join(platform_path, game_folder)
+        code_dir = os.path.join(game_folder_path, "code")
+
+        if os.path.isdir(code_dir):
+            for file in _listdir(code_dir, dirs):
+                if file.lower().endswith(".rpx"):
+                    rpx_path = os.path.join(code_dir, file)
+                    cover_img = covers.exact(game_folder, ['.jpg']) or DEFAULT_COVER
+
+                    # Folders named after a raw title ID get the name from the Wii U title database
+                    title = game_folder
+                    if WIIU_TITLE_ID.match(game_folder):
+                        title = get_title_metadata().name(game_folder) or game_folder
+
+                    game_list.append(GameEntry(
+                        title=title,
+                        platform=platform,
+                        rom_path=rpx_path,
+                        cover_path=cover_img
+                    ))
+                    break  # Only load one .rpx per game folder
+        elif os.path.isdir(game_folder_path):
+            _track(code_dir, dirs)
+
+    return game_list
+
+
+def _scan_wii(platform, platform_path, platform_covers, dirs):
+    game_list = []
+    covers = platform_covers.get(dirs)
+
+    # --- Wii hybrid support: both .rvz files and folder-based WBFS ---
+    # Handle flat RVZ, ISO, WBFS in root of /Wii
+    for file in _listdir(platform_path, dirs):
+        full_path = os.path.join(platform_path, file)
+        ext = os.path.splitext(file)[1].lower()
+
+        if not os.path.isfile(full_path) or ext not in ['.rvz', '.iso', '.wbfs']:
             continue
 
-        # --- Wii U RPX folder detection ---
-        if platform.lower() == "wiiu":
-            for game_folder in os.listdir(platform_path):
-                game_folder_path = os.path.join(platform_path, game_folder)
-                code_dir = os.path.join(game_folder_path, "code")
-
-                if os.path.isdir(code_dir):
-                    for file in os.listdir(code_dir):
-                        if file.lower().endswith(".rpx"):
-                            rpx_path = os.path.join(code_dir, file)
-                            cover_img = os.path.join(cover_path, f"{game_folder}.jpg")
-                            if not os.path.exists(cover_img):
-                                cover_img = os.path.join("assets", "default_cover.png")
-
-                            game_list.append({
-                                "platform": platform,
-                                "title": game_folder,
-                                "rom_path": rpx_path,
-                                "cover_path": cover_img
-                            })
-                            break  # Only load one .rpx per game folder
-
-        # --- Wii hybrid support: both .rvz files and folder-based WBFS ---
-        if platform.lower() == "wii":
-            # Handle flat RVZ, ISO, WBFS in root of /Wii
-            for file in os.listdir(platform_path):
-                full_path = os.path.join(platform_path, file)
-                ext = os.path.splitext(file)[1].lower()
-
-                if not os.path.isfile(full_path) or ext not in ['.rvz', '.iso', '.wbfs']:
-                    continue
-
-                title = os.path.splitext(file)[0]
-                cleaned_title = clean_title(title)
-                cover_img = os.path.join(cover_path, f"{title}.png")
-                if not os.path.exists(cover_img):
-                    cover_img = os.path.join("assets", "default_cover.png")
-
-                game_list.append({
-                    "platform": platform,
-                    "title": title,
-                    "rom_path": full_path,
-                    "cover_path": cover_img
-                })
-
-            # Handle subfolders with WBFS files and game IDs
-            for folder in os.listdir(platform_path):
-                folder_path = os.path.join(platform_path, folder)
-                if not os.path.isdir(folder_path):
-                    continue
-
-                # Extract game ID from folder name like "Game Title [GAMEID]"
-                game_id = folder.split('[')[-1].split(']')[0] if '[' in folder and ']' in folder else ""
-                title = folder.split('[')[0].strip() if '[' in folder else folder
-
-                wbfs_file = None
-                for f in os.listdir(folder_path):
-                    if f.lower().endswith('.wbfs'):
-                        wbfs_file = os.path.join(folder_path, f)
-                        break
-
-                if not wbfs_file:
-                    continue
-
-                # Cover by GAMEID
-                cover_img = os.path.join(cover_path, f"{game_id}.png") if game_id else os.path.join("assets",
-                                                                                                    "default_cover.png")
-                if not os.path.exists(cover_img):
-                    cover_img = os.path.join("assets", "default_cover.png")
-
-                game_list.append({
-                    "platform": platform,
-                    "title": title,
-                    "rom_path": wbfs_file,
-                    "cover_path": cover_img
-                })
-
-
-            continue  # Skip the flat-file scanner for Wii
-
-        if platform.lower() == "gamecube":
-            for entry in os.listdir(platform_path):
-                full_path = os.path.join(platform_path, entry)
-
-                # --- Handle folder-based games ---
-                if os.path.isdir(full_path):
-                    iso_file = None
-                    for subfile in os.listdir(full_path):
-                        if subfile.lower().endswith(".iso"):
-                            iso_file = subfile
-                            break
-                    if not iso_file:
-                        continue  # Skip folders with no ISO
-
-                    # Attempt to extract GameID
-                    game_id = ""
-                    if "[" in entry and "]" in entry:
-                        game_id = entry.split('[')[-1].split(']')[0]
-                        title = entry.split('[')[0].strip()
-                    else:
-                        # Check for GameID-looking text at end (like "Mario Kart GGPE01")
-                        parts = entry.split()
-                        last_part = parts[-1] if parts else ""
-                        game_id = last_part if len(last_part) == 6 else ""
-                        title = entry.replace(game_id, "").strip() if game_id else entry
-
-                    # Cover matching
-                    cover_img = os.path.join(cover_path, f"{game_id}.png") if game_id else None
-                    if not cover_img or not os.path.exists(cover_img):
-                        # fallback to fuzzy match
-                        matched_file = None
-                        if os.path.exists(cover_path):
-                            for cover_file in os.listdir(cover_path):
-                                if clean_title(os.path.splitext(cover_file)[0]) == clean_title(title):
-                                    matched_file = cover_file
-                                    break
-                        cover_img = os.path.join(cover_path, matched_file) if matched_file else os.path.join("assets", "default_cover.png")
-
-                    game_list.append({
-                        "platform": platform,
-                        "title": title,
-                        "rom_path": os.path.join(full_path, iso_file),
-                        "cover_path": cover_img
-                    })
-
-                # --- Flat ISO files ---
-                elif os.path.isfile(full_path) and entry.lower().endswith(".iso"):
-                    title = os.path.splitext(entry)[0]
-                    cleaned_title = clean_title(title)
-
-                    cover_img = None
-                    for ext in ['.png', '.jpg']:
-                        if os.path.exists(os.path.join(cover_path, title + ext)):
-                            cover_img = os.path.join(cover_path, title + ext)
-                            break
-
-                    if not cover_img and os.path.exists(cover_path):
-                        for cover_file in os.listdir(cover_path):
-                            if clean_title(os.path.splitext(cover_file)[0]) == cleaned_title:
-                                cover_img = os.path.join(cover_path, cover_file)
-                                break
-
-                    if not cover_img:
-                        cover_img = os.path.join("assets", "default_cover.png")
-
-                    game_list.append({
-                        "platform": platform,
-                        "title": title,
-                        "rom_path": full_path,
-                        "cover_path": cover_img
-                    })
-
-        # --- Flat file ROMs for all other platforms ---
-        for file in os.listdir(platform_path):
-            full_rom_path = os.path.join(platform_path, file)
-            if not os.path.isfile(full_rom_path):
-                continue
-
-            ext = os.path.splitext(file)[1].lower()
-
-            if platform.lower() in ["ps1", "playstation", "playstation1"] and ext != ".cue":
-                continue
-
-            if ext not in SUPPORTED_EXTENSIONS:
-                continue
-
-            title = os.path.splitext(file)[0]
-            cleaned_title = clean_title(title)
-
-            # Try exact match first
-            cover_img = None
-            for ext_img in ['.jpg', '.png']:
-                potential = os.path.join(cover_path, f"{title}{ext_img}")
-                if os.path.exists(potential):
-                    cover_img = potential
+        title = os.path.splitext(file)[0]
+        cover_img = covers.exact(title, ['.png']) or covers.game_id(read_game_id(full_path)) or DEFAULT_COVER
+
+        game_list.append(GameEntry(
+            title=title,
+            platform=platform,
+            rom_path=full_path,
+            cover_path=cover_img
+        ))
+
+    # Handle subfolders with WBFS files and game IDs
+    for folder in _listdir(platform_path, dirs):
+        folder_path = os.path.join(platform_path, folder)
+        if not os.path.isdir(folder_path):
+            continue
+
+        # Folder names look like "Game Title [GAMEID]"; the ID in the disc header wins if present
+        folder_id = folder.split('[')[-1].split(']')[0] if '[' in folder and ']' in folder else ""
+        title = folder.split('[')[0].strip() if '[' in folder else folder
+
+        wbfs_file = None
+        for f in _listdir(folder_path, dirs):
+            if f.lower().endswith('.wbfs'):
+                wbfs_file = os.path.join(folder_path, f)
+                break
+
+        if not wbfs_file:
+            continue
+
+        # Cover by GAMEID
+        game_id = read_game_id(wbfs_file) or folder_id
+        cover_img = covers.game_id(game_id) or DEFAULT_COVER
+
+        game_list.append(GameEntry(
+            title=title,
+            platform=platform,
+            rom_path=wbfs_file,
+            cover_path=cover_img
+        ))
+
+    return game_list
+
+
+def _scan_gamecube(platform, platform_path, platform_covers, dirs):
+    game_list = []
+    covers = platform_covers.get(dirs)
+
+    for entry in _listdir(platform_path, dirs):
+        full_path = os.path.join(platform_path, entry)
+
+        # --- Handle folder-based games ---
+        if os.path.isdir(full_path):
+            iso_file = None
+            for subfile in _listdir(full_path, dirs):
+                if subfile.lower().endswith(".iso"):
+                    iso_file = subfile
                     break
+            if not iso_file:
+                continue  # Skip folders with no ISO
+
+            # Attempt to extract GameID from the folder name
+            game_id = ""
+            if "[" in entry and "]" in entry:
+                game_id = entry.split('[')[-1].split(']')[0]
+                title = entry.split('[')[0].strip()
+            else:
+                # Check for GameID-looking text at end (like "Mario Kart GGPE01")
+                parts = entry.split()
+                last_part = parts[-1] if parts else ""
+                game_id = last_part if len(last_part) == 6 else ""
+                title = entry.replace(game_id, "").strip() if game_id else entry
+
+            # The ID in the disc header is authoritative; the folder name is only a fallback
+            game_id = read_game_id(os.path.join(full_path, iso_file)) or game_id
+
+            # Cover matching, falling back to fuzzy match
+            cover_img = covers.game_id(game_id) or covers.fuzzy(title) or DEFAULT_COVER
+
+            game_list.append(GameEntry(
+                title=title,
+                platform=platform,
+                rom_path=os.path.join(full_path, iso_file),
+                cover_path=cover_img
+            ))
+
+        # --- Flat ISO files ---
+        elif os.path.isfile(full_path) and entry.lower().endswith(".iso"):
+            title = os.path.splitext(entry)[0]
+            cover_img = (covers.exact(title, ['.png', '.jpg']) or covers.game_id(read_game_id(full_path))
+                         or covers.fuzzy(title) or DEFAULT_COVER)
+
+            game_list.append(GameEntry(
+                title=title,
+                platform=platform,
+                rom_path=full_path,
+                cover_path=cover_img
+            ))
+
+    return game_list
 
-            # Fallback to fuzzy match
-            if not cover_img and os.path.exists(cover_path):
-                for cover_file in os.listdir(cover_path):
-                    if clean_title(os.path.splitext(cover_file)[0]) == cleaned_title:
-                        cover_img = os.path.join(cover_path, cover_file)
-                        break
 
-            if not cover_img:
-                cover_img = os.path.join("assets", "default_cover.png")
+def _scan_flat_files(platform, platform_path, platform_covers, dirs):
+    game_list = []
+    covers = platform_covers.get(dirs)
+
+    # --- Flat file ROMs for all other platforms ---
+    for file in _listdir(platform_path, dirs):
+        full_rom_path = os.path.join(platform_path, file)
+        if not os.path.isfile(full_rom_path):
+            continue
 
-            game_list.append({
-                "platform": platform,
-                "title": title.split("[")[0].strip() if "[" in title else title,
-                "rom_path": full_rom_path,
-                "cover_path": cover_img
-            })
+        ext = os.path.splitext(file)[1].lower()
+
+        if platform.lower() in ["ps1", "playstation", "playstation1"] and ext != ".cue":
+            continue
+
+        if ext not in SUPPORTED_EXTENSIONS:
+            continue
+
+        title = os.path.splitext(file)[0]
+
+        # Try exact match first, then the ID from the ROM/disc header, then fuzzy match
+        cover_img = (covers.exact(title, ['.jpg', '.png']) or covers.game_id(read_game_id(full_rom_path))
+                     or covers.fuzzy(title) or DEFAULT_COVER)
+
+        game_list.append(GameEntry(
+            title=title.split("[")[0].strip() if "[" in title else title,
+            platform=platform,
+            rom_path=full_rom_path,
+            cover_path=cover_img
+        ))
 
     return game_list
+
+
+def _platform_passes(platform):
+    """
+    Returns the (name, scan function) passes that make up one ROMs/<platform> folder.
+    Wii U and GameCube folders also get the generic flat-file pass; Wii does not.
+    """
+    kind = platform.lower()
+    if kind == "wiiu":
+        return [("wiiu", _scan_wiiu), ("flat", _scan_flat_files)]
+    if kind == "wii":
+        return [("wii", _scan_wii)]
+    if kind == "gamecube":
+        return [("gamecube", _scan_gamecube), ("flat", _scan_flat_files)]
+    return [("flat", _scan_flat_files)]
+
+
+def collect_passes(rom_base_dir, cover_base_dir):
+    # Ordered list of (index key, platform, scan function, args); results are merged in this order
+    covers = {}  # cover folder -> PlatformCovers, one per platform for this scan
+
+    def platform_covers(platform):
+        cover_path = os.path.join(cover_base_dir, platform)
+        if cover_path not in covers:
+            covers[cover_path] = PlatformCovers(cover_path)
+        return covers[cover_path]
+
+    passes = [(INSTALLED_PS3_PATH, "PS3", _scan_installed_ps3, (platform_covers("PS3"),))]
+
+    # --- Scan ROMs/ folders ---
+    try:
+        platforms = sorted(os.listdir(rom_base_dir))
+    except FileNotFoundError:
+        platforms = []  # no ROMs/ yet; the library watcher picks it up once it's created
+
+    for platform in platforms:
+        platform_path = os.path.join(rom_base_dir, platform)
+
+        if not os.path.isdir(platform_path):
+            continue
+
+        for pass_name, scan_fn in _platform_passes(platform):
+            key = f"{platform_path}#{pass_name}"
+            passes.append((key, platform, scan_fn, (platform, platform_path, platform_covers(platform))))
+
+    return passes
+
+
+def run_pass(entry, scan_fn, args):
+    """
+    Returns the index entry for one scan pass, reusing the cached entry when none of
+    the directories it listed last time have changed. Returns (entry, rescanned).
+    If the pass fails (e.g. a game folder it can't read), the error is logged and the
+    cached entry, or None if there is none, is returned so the other passes carry on.
+    Its directories are still stale, so the pass is retried on the next scan.
+    """
+    if is_fresh(entry):
+        return entry, False
+
+    dirs = {}
+    try:
+        games = scan_fn(*args, dirs)
+    except Exception as e:
+        print(f"[ERROR] Scan pass {scan_fn.__name__} failed: {e}")
+        return entry, False
+    return {"dirs": dirs, "games": games}, True
+
+
+def _iter_passes(rom_base_dir, cover_base_dir, use_index, workers, db=None):
+    """
+    Runs every scan pass and yields (position, platform, games) as each one finishes.
+    The library index is saved once all passes have completed. With a LibraryDatabase,
+    the catalog is the index instead: it is loaded from the database and passes that
+    were re-walked (or are missing from the catalog) are written into it.
+    """
+    if db is not None:
+        stored = db.load_index()
+        catalogued = set(stored["passes"])
+        index = stored if use_index else {"passes": {}}
+    else:
+        index = load_index() if use_index else {"passes": {}}
+        catalogued = set()
+    passes = collect_passes(rom_base_dir, cover_base_dir)
+
+    def run(position):
+        key, _, scan_fn, args = passes[position]
+        return run_pass(index["passes"].get(key), scan_fn, args)
+
+    new_passes = {}
+    changed = False
+
+    def finish(position, result):
+        nonlocal changed
+        entry, rescanned = result
+        key = passes[position][0]
+        if entry is None:
+            return position, passes[position][1], []  # failed with nothing cached to fall back on
+        new_passes[key] = entry
+        changed |= rescanned
+        if db is not None and (rescanned or key not in catalogued):
+            db.replace_pass(key, position, entry)
+        return position, passes[position][1], entry["games"]
+
+    if workers and workers > 1:
+        # Scanning is dominated by waiting on (often removable) storage, so threads are enough
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run, position): position for position in range(len(passes))}
+            for future in as_completed(futures):
+                yield finish(futures[future], future.result())
+    else:
+        for position in range(len(passes)):
+            yield finish(position, run(position))
+
+    # Passes for platform folders that no longer exist are dropped from the index
+    changed |= set(new_passes) != set(index["passes"])
+    index["passes"] = new_passes
+
+    if db is not None and catalogued - set(new_passes):
+        db.remove_passes(catalogued - set(new_passes))
+
+    if use_index and changed and db is None:
+        save_index(index)
+
+
+def iter_scan_roms(rom_base_dir, cover_base_dir, use_index=True, workers=DEFAULT_SCAN_WORKERS, db=None):
+    """
+    Streaming version of scan_roms: yields (platform, games) as soon as each scan pass
+    finishes, so callers can show cached or fast platforms before slow ones are done.
+    A platform may be yielded more than once (e.g. installed PS3 games and ROMs/PS3).
+    """
+    for _, platform, games in _iter_passes(rom_base_dir, cover_base_dir, use_index, workers, db):
+        if games:
+            yield platform, games
+
+
+def scan_roms(rom_base_dir, cover_base_dir, use_index=True, workers=DEFAULT_SCAN_WORKERS, db=None):
+    """
+    Scans the ROMs and Covers folders and returns a list of game dictionaries.
+    With use_index, results are loaded from the on-disk library index and only
+    passes whose directories changed since the last scan are re-walked.
+    Passes run on a pool of `workers` threads; results keep the same order either way.
+    Passing a LibraryDatabase as db uses that catalog as the index instead.
+    """
+    results = sorted(_iter_passes(rom_base_dir, cover_base_dir, use_index, workers, db), key=lambda r: r[0])
+    return [game for _, _, games in results for game in games]
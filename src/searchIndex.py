@@ -0,0 +1,153 @@
+import heapq
+import threading
+from src.utils import clean_title
+
+MAX_RESULTS = 200
+NGRAM = 3
+COMPACT_MIN_DEAD = 64  # removed slots tolerated before the index is rebuilt
+
+
+def _ngrams(text, n=NGRAM):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _game_id(game):
+    # Wii/GameCube style "[GAMEID]" tags in the ROM path, e.g. "Zelda [SOUE01]/SOUE01.wbfs"
+    rom_path = game.rom_path
+    if '[' in rom_path and ']' in rom_path:
+        return rom_path.split('[')[-1].split(']')[0].lower()
+    return ""
+
+
+class SearchIndex:
+    """
+    Prebuilt index over game titles for the Home screen search bar.
+
+    Every query token must appear somewhere in the game's searchable text (its
+    clean_title plus platform and game ID). Tokens of NGRAM characters or more are
+    looked up through an n-gram table; shorter ones are checked directly. When the
+    query extends the previous one, only the previous matches are re-checked.
+    """
+
+    def __init__(self, games=()):
+        self._games = []
+        self._titles = []      # clean_title of each game
+        self._words = []       # title split into words, for prefix ranking
+        self._haystacks = []   # title + platform + game ID, what tokens are matched against
+        self._grams = {}       # n-gram -> set of game positions
+        self._positions = {}   # (platform, rom_path) -> positions, for removals
+        self._dead = 0         # removed slots still taking up space
+        self._last_query = None
+        self._last_matches = None
+        self._lock = threading.Lock()  # searches may run off the UI thread while games are added
+        self.add(games)
+
+    def __len__(self):
+        return len(self._games) - self._dead
+
+    def add(self, games):
+        with self._lock:
+            self._add(games)
+
+    def _add(self, games):
+        for game in games:
+            position = len(self._games)
+            title = clean_title(game.title)
+            haystack = " ".join(part for part in (title, game.platform.lower(), _game_id(game)) if part)
+
+            self._games.append(game)
+            self._titles.append(title)
+            self._words.append(title.split())
+            self._haystacks.append(haystack)
+            self._positions.setdefault(game.key, []).append(position)
+            for gram in _ngrams(haystack):
+                self._grams.setdefault(gram, set()).add(position)
+
+        # New games may match the cached query, so the next search starts from scratch
+        self._last_query = None
+        self._last_matches = None
+
+    def remove(self, games):
+        with self._lock:
+            for game in games:
+                for position in self._positions.pop(game.key, []):
+                    # An empty haystack never contains a query token, so the slot stops matching
+                    self._haystacks[position] = ""
+                    self._dead += 1
+            self._last_query = None
+            self._last_matches = None
+
+            # Renames and updates from the library watcher remove and re-add; rebuild once
+            # dead slots make up a quarter of the index so it doesn't grow without bound
+            if self._dead >= COMPACT_MIN_DEAD and self._dead * 4 >= len(self._games):
+                self._compact()
+
+    def _compact(self):
+        live = [game for position, game in enumerate(self._games) if self._haystacks[position]]
+        self._games = []
+        self._titles = []
+        self._words = []
+        self._haystacks = []
+        self._grams = {}
+        self._positions = {}
+        self._dead = 0
+        self._add(live)
+
+    def _candidates(self, tokens):
+        # Intersect the n-gram postings of every long token, smallest set first
+        postings = []
+        for token in tokens:
+            if len(token) < NGRAM:
+                continue
+            for gram in _ngrams(token):
+                postings.append(self._grams.get(gram, set()))
+
+        if not postings:
+            return range(len(self._games))
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    def _rank(self, position, query, tokens):
+        title = self._titles[position]
+        words = self._words[position]
+        if title == query:
+            score = 0
+        elif title.startswith(query):
+            score = 1
+        elif all(any(word.startswith(token) for word in words) for token in tokens):
+            score = 2
+        else:
+            score = 3
+        return score, title
+
+    def search(self, query, limit=MAX_RESULTS):
+        """
+        Returns up to `limit` games matching query, best matches first:
+        exact title, then title prefix, then word prefixes, then other substring matches.
+        """
+        query = clean_title(query)
+        if not query:
+            return []
+        with self._lock:
+            return self._search(query, query.split(), limit)
+
+    def _search(self, query, tokens, limit):
+        if self._last_query is not None and query.startswith(self._last_query):
+            # Typing more characters can only narrow the previous matches
+            candidates = self._last_matches
+        else:
+            candidates = self._candidates(tokens)
+
+        haystacks = self._haystacks
+        matches = [p for p in candidates if all(token in haystacks[p] for token in tokens)]
+        self._last_query = query
+        self._last_matches = matches
+
+        ranked = heapq.nsmallest(limit, matches, key=lambda p: self._rank(p, query, tokens))
+        return [self._games[p] for p in ranked]
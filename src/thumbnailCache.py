@@ -0,0 +1,88 @@
+import hashlib
+import os
+import threading
+from PIL import Image
+
+THUMBNAIL_DIR = os.path.join("cache", "thumbnails")
+THUMBNAIL_SIZE = (150, 212)
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+
+_lock = threading.Lock()
+_cache_bytes = None  # Total size of THUMBNAIL_DIR, computed on first write
+
+
+def _thumbnail_key(source_path, mtime_ns, size):
+    key = f"{os.path.abspath(source_path)}|{mtime_ns}|{size[0]}x{size[1]}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def get_thumbnail(source_path, size=THUMBNAIL_SIZE, max_bytes=MAX_CACHE_BYTES):
+    """
+    Returns the path of a pre-scaled copy of source_path that fits inside size,
+    generating it on first use. Thumbnails are keyed by source path, mtime and size,
+    so replacing a cover invalidates its thumbnail automatically.
+    Falls back to source_path if the image can't be read or scaled.
+    """
+    try:
+        mtime_ns = os.stat(source_path).st_mtime_ns
+    except OSError:
+        return source_path
+
+    size = tuple(size)
+    thumb_path = os.path.join(THUMBNAIL_DIR, _thumbnail_key(source_path, mtime_ns, size) + ".png")
+
+    if os.path.exists(thumb_path):
+        try:
+            # Bump mtime so eviction treats it as recently used
+            os.utime(thumb_path)
+        except OSError:
+            pass
+        return thumb_path
+
+    try:
+        with Image.open(source_path) as img:
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+            img.thumbnail(size, Image.Resampling.LANCZOS)
+
+            os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+            tmp_path = f"{thumb_path}.{threading.get_ident()}.tmp"
+            img.save(tmp_path, "PNG")
+            os.replace(tmp_path, thumb_path)
+    except Exception as e:
+        print(f"[ERROR] Could not create thumbnail for {source_path}: {e}")
+        return source_path
+
+    _account_and_evict(os.path.getsize(thumb_path), max_bytes)
+    return thumb_path
+
+
+def _account_and_evict(added_bytes, max_bytes):
+    """
+    Tracks the cache size and, once it exceeds max_bytes, deletes the least recently
+    used thumbnails until it is back under 90% of the limit.
+    """
+    global _cache_bytes
+
+    with _lock:
+        if _cache_bytes is None:
+            _cache_bytes = sum(entry.stat().st_size for entry in os.scandir(THUMBNAIL_DIR) if entry.is_file())
+        else:
+            _cache_bytes += added_bytes
+
+        if _cache_bytes <= max_bytes:
+            return
+
+        entries = sorted(
+            (entry for entry in os.scandir(THUMBNAIL_DIR) if entry.is_file()),
+            key=lambda entry: entry.stat().st_mtime
+        )
+        target = max_bytes * 0.9
+        for entry in entries:
+            if _cache_bytes <= target:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                _cache_bytes -= size
+            except OSError:
+                pass
@@ -0,0 +1,164 @@
+import csv
+import json
+import os
+import re
+import sqlite3
+import threading
+
+PS3_GAMES_TSV = os.path.join("Tools", "Download PS3 Titles", "PS3_GAMES.tsv")
+PS3_DLCS_TSV = os.path.join("Tools", "Download PS3 Titles", "PS3_DLCS.tsv")
+WIIU_TITLEDB = os.path.join("Tools", "Download Wii U Titles", "nusdm_1.1", "titledb.json")
+METADATA_DB_FILE = os.path.join("cache", "title_metadata.db")
+
+WIIU_TITLE_ID = re.compile(r"^[0-9A-Fa-f]{16}$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS titles (
+    title_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    kind TEXT NOT NULL,         -- "game" or "dlc"
+    name TEXT NOT NULL,
+    region TEXT NOT NULL DEFAULT '',
+    content_id TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_titles_id ON titles (title_id, kind);
+CREATE INDEX IF NOT EXISTS idx_titles_source ON titles (source);
+"""
+
+
+def _read_ps3_tsv(path, kind):
+    # NPS Browser exports: Title ID, Region, Name, PKG link, RAP, Content ID, ...
+    with open(path, 'r', encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        next(reader, None)  # header row
+        for row in reader:
+            if len(row) >= 6 and row[0] and row[2]:
+                yield row[0].upper(), "PS3", kind, row[2].strip(), row[1], row[5]
+
+
+def _read_wiiu_titledb(path):
+    with open(path, 'r', encoding="utf-8") as f:
+        titles = json.load(f)
+    for title in titles if isinstance(titles, list) else []:
+        if isinstance(title, dict) and title.get("titleID") and title.get("name"):
+            # Names are split over two lines for the console's menu, e.g. "TEKKEN TAG TOURNAMENT 2\nWii U EDITION"
+            name = " ".join(title["name"].split())
+            yield title["titleID"].upper(), "WiiU", "game", name, title.get("region", ""), ""
+
+
+SOURCES = (
+    (PS3_GAMES_TSV, lambda path: _read_ps3_tsv(path, "game")),
+    (PS3_DLCS_TSV, lambda path: _read_ps3_tsv(path, "dlc")),
+    (WIIU_TITLEDB, _read_wiiu_titledb),
+)
+
+
+class TitleMetadata:
+    """
+    Title ID -> name/region/content ID lookups over the PS3 TSVs and the Wii U titledb
+    shipped in Tools/. The sources are imported once into a small SQLite cache, and a
+    source is only re-imported when its mtime changes, so startup never re-parses
+    20k rows. Lookups are memoised in memory on top of the indexed query.
+    """
+
+    def __init__(self, path=METADATA_DB_FILE, sources=SOURCES):
+        self.path = path
+        self._lock = threading.Lock()
+        self._memo = {}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._refresh(sources)
+
+    def _refresh(self, sources):
+        known = dict(self._conn.execute("SELECT path, mtime_ns FROM sources"))
+        for source_path, reader in sources:
+            try:
+                mtime_ns = os.stat(source_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if known.get(source_path) == mtime_ns:
+                continue
+
+            try:
+                rows = list(reader(source_path)) if mtime_ns is not None else []
+            except (OSError, ValueError, csv.Error) as e:
+                print(f"[WARN] Could not read title metadata from {source_path}: {e}")
+                continue
+
+            with self._conn:
+                self._conn.execute("DELETE FROM titles WHERE source = ?", (source_path,))
+                self._conn.executemany(
+                    "INSERT INTO titles (title_id, platform, kind, name, region, content_id, source)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [row + (source_path,) for row in rows]
+                )
+                if mtime_ns is None:
+                    self._conn.execute("DELETE FROM sources WHERE path = ?", (source_path,))
+                else:
+                    self._conn.execute("INSERT OR REPLACE INTO sources (path, mtime_ns) VALUES (?, ?)",
+                                       (source_path, mtime_ns))
+
+    def lookup(self, title_id):
+        """
+        Returns {"title_id", "platform", "kind", "name", "region", "content_id"} for a
+        title ID such as "BCUS98181" or "0005000010101C00", preferring the base game
+        over DLC entries. Returns None for unknown IDs.
+        """
+        if not title_id:
+            return None
+        title_id = title_id.upper()
+        with self._lock:
+            if title_id not in self._memo:
+                row = self._conn.execute(
+                    "SELECT title_id, platform, kind, name, region, content_id FROM titles"
+                    " WHERE title_id = ? ORDER BY kind = 'dlc', rowid LIMIT 1",
+                    (title_id,)
+                ).fetchone()
+                keys = ("title_id", "platform", "kind", "name", "region", "content_id")
+                self._memo[title_id] = dict(zip(keys, row)) if row else None
+            return self._memo[title_id]
+
+    def name(self, title_id):
+        info = self.lookup(title_id)
+        return info["name"] if info else None
+
+
+_metadata = None
+_metadata_lock = threading.Lock()
+
+
+def _open_title_metadata():
+    try:
+        return TitleMetadata()
+    except sqlite3.OperationalError as e:
+        # Locked by another launcher instance, or can't be opened at all; not corruption
+        error = e
+    except sqlite3.DatabaseError:
+        print(f"Error: {METADATA_DB_FILE} is corrupted. Rebuilding.")
+        try:
+            os.remove(METADATA_DB_FILE)
+            return TitleMetadata()
+        except (OSError, sqlite3.Error) as e:
+            error = e
+    except OSError as e:
+        error = e
+
+    # The cache can't be written (locked by another instance, read-only drive, ...);
+    # import into memory for this session rather than failing the scan
+    print(f"[WARN] Could not open {METADATA_DB_FILE}: {error}. Title metadata won't be cached.")
+    return TitleMetadata(":memory:")
+
+
+def get_title_metadata():
+    # Shared by the scanner's worker threads; the first caller pays for the (cached) import
+    global _metadata
+    with _metadata_lock:
+        if _metadata is None:
+            _metadata = _open_title_metadata()
+        return _metadata
@@ -11,6 +11,9 @@ from kivy.uix.gridlayout import GridLayout
 from kivy.uix.image import Image as KivyImage
 from kivy.uix.label import Label
 from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recyclegridlayout import RecycleGridLayout
 from kivy.uix.screenmanager import ScreenManager, Screen
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.textinput import TextInput
@@ -19,42 +22,57 @@ from kivy.uix.anchorlayout import AnchorLayout
 from kivy.graphics import Color, Rectangle, Line
 from kivy.utils import platform
 from kivy.core.window import Keyboard
+from kivy.clock import Clock
+from kivy.animation import Animation
 import threading
 
-from src.romScanner import scan_roms
-from src.gameLauncher import launch_game
+from src.romScanner import iter_scan_roms
+from src.gameEntry import DEFAULT_COVER, entries_to_json
+from src.config import load_config
+from src.coverLoader import CoverLoader
+from src.favoritesStore import get_favorites_store
+from src.searchIndex import SearchIndex
+from src.libraryWatcher import LibraryWatcher
+from src.libraryDb import LibraryDatabase
+from src.romHasher import RomHasher
+from src.assetManager import AssetManager
+from src.gameLauncher import get_supervisor
+from src.emulatorRegistry import get_registry
+from src.inputDispatcher import InputDispatcher
+from src.preWarmer import PreWarmer
 from src.Recent import load_recent as load_recent_games, save_recent
 
 
 RECENT_FILE = "recent.json"
-FAVORITES_FILE = "favorites.json"
+PREFETCH_DELAY = 0.5  # seconds on a tab before its neighbours are built
+SEARCH_DEBOUNCE = 0.15  # seconds of no typing before the search runs
+SCROLL_DURATION = 0.1  # seconds for the grid to glide to a newly focused row
+TILE_HEIGHT = 250
 
-focused_game_index = 0
-focused_game_buttons = []
-focus_mode = "none"  # can be "tab" or "grid"
-focused_tab_index = 0
 
+def asset(path):
+    # Atlas region for a bundled icon once the app has built its atlas, otherwise the file itself
+    manager = getattr(App.get_running_app(), "asset_manager", None)
+    return manager.source(path) if manager is not None else path
+
+
+def _library_db():
+    # The optional SQLite catalog, or None when it is disabled in config.json
+    app = App.get_running_app()
+    return getattr(app, "library_db", None)
 
-def load_favorites():
-    if os.path.exists(FAVORITES_FILE):
-        with open(FAVORITES_FILE, 'r') as f:
-            return json.load(f)
-    return []
 
 def add_to_recent(game_info):
-    recent = load_recent_games()
-    new_entry = {
-        "title": game_info["title"],
-        "platform": game_info["platform"],
-        "rom_path": game_info["rom_path"],
-        "cover_path": game_info["cover_path"]
-    }
-    recent = [g for g in recent if g["title"] != new_entry["title"]]
-    recent.insert(0, new_entry)
+    db = _library_db()
+    if db is not None:
+        db.record_play(game_info)
+
+    recent = [g for g in load_recent_games() if g.title != game_info.title]
+    recent.insert(0, game_info)
     if len(recent) > 5:
         recent = recent[:5]
     with open(RECENT_FILE, 'w') as f:
-        json.dump(recent, f)
+        json.dump(entries_to_json(recent), f)
 
 
 from kivy.uix.relativelayout import RelativeLayout
@@ -71,20 +89,16 @@ import json
 import os
 
 
-class GameButton(ButtonBehavior, FloatLayout):
-    def __init__(self, game_info, **kwargs):
-        super(GameButton, self).__init__(size_hint=(1, None), height=250, **kwargs)
-        self.game_info = game_info
-        self.is_favorited = self._is_in_favorites()
-
-        # Fallback cover image if missing
-        image_path = game_info.get("cover_path") or "assets/placeholder.png"
-        if not os.path.exists(image_path):
-            image_path = "assets/placeholder.png"
+class GameButton(RecycleDataViewBehavior, ButtonBehavior, FloatLayout):
+    def __init__(self, game_info=None, **kwargs):
+        super(GameButton, self).__init__(size_hint=(1, None), height=TILE_HEIGHT, **kwargs)
+        self.game_info = None
+        self.is_favorited = False
+        self._cover_request = None
+        self._cover_wanted = False  # the real cover hasn't been shown yet
 
         # Game cover image
         self.image = KivyImage(
-            source=image_path,
             allow_stretch=True,
             keep_ratio=True,
             size_hint=(1, 0.85),
@@ -94,7 +108,6 @@ class GameButton(ButtonBehavior, FloatLayout):
 
         # Game title label
         self.label = Label(
-            text=game_info["title"],
             size_hint=(1, 0.15),
             pos_hint={"x": 0, "y": 0},
             halign="center",
@@ -108,7 +121,7 @@ class GameButton(ButtonBehavior, FloatLayout):
 
         # Favorite star icon (top-right)
         self.star_button = StarButton(
-            source="assets/star_filled.png" if self.is_favorited else "assets/star_empty.png",
+            source=asset("assets/star_empty.png"),
             size_hint=(None, None),
             size=(32, 32),
             pos_hint={"right": 1, "top": 1}
@@ -122,25 +135,70 @@ class GameButton(ButtonBehavior, FloatLayout):
             self.rect = Rectangle(size=self.size, pos=self.pos)
         self.bind(size=self.update_rect, pos=self.update_rect)
 
-    def _is_in_favorites(self):
-        favorites = load_favorites()
-        return any(f["title"] == self.game_info["title"] for f in favorites)
+        if game_info is not None:
+            self.set_game(game_info)
 
-    def toggle_favorite(self, *args):
-        favorites = load_favorites()
-        title = self.game_info["title"]
-
-        if self.is_favorited:
-            favorites = [f for f in favorites if f["title"] != title]
-            self.is_favorited = False
+    def set_game(self, game_info):
+        # Binds this tile to a game; recycled tiles are rebound as the grid scrolls
+        self.game_info = game_info
+        self.is_favorited = self._is_in_favorites()
+        self._load_cover(game_info)
+        self.label.text = game_info.title
+        self.star_button.source = asset("assets/star_filled.png" if self.is_favorited else "assets/star_empty.png")
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        if data["game_info"] is not self.game_info:
+            self.set_game(data["game_info"])
         else:
-            favorites.insert(0, self.game_info)
-            self.is_favorited = True
+            self.ensure_cover()
+        self.set_focus(data.get("focused", False))
+
+    def _load_cover(self, game_info):
+        # Show the shared default cover straight away and swap in the real one when it's decoded
+        loader = App.get_running_app().cover_loader
+        self.cancel_cover()
+        self._cover_wanted = False
+        self.image.texture = loader.static_texture(asset(DEFAULT_COVER))
+        if game_info.has_default_cover:
+            return
+
+        if not game_info.cover_path or not os.path.exists(game_info.cover_path):
+            # Fallback cover image if missing
+            self.image.texture = loader.static_texture(asset("assets/placeholder.png")) or self.image.texture
+            return
+
+        self._cover_wanted = True
+        self._request_cover(loader)
+
+    def _request_cover(self, loader):
+        game_info = self.game_info
+
+        def on_cover(texture):
+            if self.game_info is game_info:
+                self.image.texture = texture
+                self._cover_wanted = False
+                self._cover_request = None
+        self._cover_request = loader.request(game_info.cover_path, on_cover)
 
-        with open(FAVORITES_FILE, "w") as f:
-            json.dump(favorites, f)
+    def ensure_cover(self):
+        # A tile shown again for the same game re-asks for a cover cancelled while it was off screen
+        if self._cover_wanted and self._cover_request is None:
+            self._request_cover(App.get_running_app().cover_loader)
+
+    def cancel_cover(self):
+        # Called when the tile is rebound or scrolls out of view; a scrolled-out tile still
+        # wants its cover and asks again through ensure_cover() once it is back on screen
+        if self._cover_request is not None:
+            self._cover_request.cancel()
+            self._cover_request = None
+
+    def _is_in_favorites(self):
+        return get_favorites_store().contains(self.game_info)
 
-        self.star_button.source = "assets/star_filled.png" if self.is_favorited else "assets/star_empty.png"
+    def toggle_favorite(self, *args):
+        self.is_favorited = toggle_favorite(self.game_info)
+        self.star_button.source = asset("assets/star_filled.png" if self.is_favorited else "assets/star_empty.png")
         self.star_button.reload()
 
     def update_rect(self, *args):
@@ -151,13 +209,224 @@ class GameButton(ButtonBehavior, FloatLayout):
         self.bg_color.rgba = (0.2, 0.6, 1, 0.4) if focused else (1, 1, 1, 0)
 
     def on_press(self):
-        from kivy.app import App
-        add_to_recent(self.game_info)
-        App.get_running_app().launch_game_and_release(
-            self.game_info['platform'],
-            self.game_info['rom_path']
+        play_game(self.game_info)
+
+
+def toggle_favorite(game_info):
+    # Returns True if the game is now a favorite; the store writes favorites.json in the background
+    is_favorited = get_favorites_store().toggle(game_info)
+    db = _library_db()
+    if db is not None:
+        db.set_favorite(game_info, is_favorited)
+    return is_favorited
+
+
+def play_game(game_info):
+    add_to_recent(game_info)
+    App.get_running_app().launch_game_and_release(
+        game_info.platform,
+        game_info.rom_path,
+        game_info.title
+    )
+
+
+def _title_key(game_info):
+    return game_info.title.casefold()
+
+
+def _by_title(items):
+    return sorted(items, key=lambda item: _title_key(item["game_info"]))
+
+
+class GameGrid(RecycleView):
+    """
+    Virtualized grid of GameButtons. Only the visible rows plus a small buffer exist as
+    widgets; they are rebound to other games as the grid scrolls, so build time and
+    memory don't grow with the size of the library. Tiles are addressed by index.
+    With sort_by_title the data is kept in title order (ignoring case) as games are
+    added or renamed; otherwise games stay in the order they were given.
+    """
+
+    def __init__(self, games=(), cols=5, sort_by_title=False, **kwargs):
+        super(GameGrid, self).__init__(**kwargs)
+        self.cols = cols
+        self.sort_by_title = sort_by_title
+        self.layout_manager = RecycleGridLayout(
+            cols=cols,
+            spacing=10,
+            padding=10,
+            default_size=(None, TILE_HEIGHT),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        self.layout_manager.bind(minimum_height=self.layout_manager.setter('height'))
+        self.add_widget(self.layout_manager)
+        self.viewclass = GameButton
+        self.set_games(games)
+
+        self._scroll_index = None
+        self._scroll_goal = None  # scroll_y a running focus animation is heading to
+        self._scroll_trigger_focus = Clock.create_trigger(self._apply_scroll)
+
+        # Once scrolling settles, drop cover loads for tiles that left the screen and warm the next rows
+        self._scroll_trigger = Clock.create_trigger(self._on_scrolled, 0.1)
+        self.bind(scroll_y=self._scroll_trigger)
+
+    def set_games(self, games):
+        self.focused_index = -1
+        self._letter_starts = None
+        items = [{"game_info": game, "focused": False} for game in games]
+        self.data = _by_title(items) if self.sort_by_title else items
+
+    def add_games(self, games):
+        self._letter_starts = None
+        items = [{"game_info": game, "focused": False} for game in games]
+        if self.sort_by_title:
+            self._resort(self.data + items)
+        else:
+            self.data.extend(items)
+
+    def _resort(self, items):
+        # The focused tile may move; focused_index follows it (InputDispatcher.clamp picks it up)
+        focused = self.game_at(self.focused_index) if 0 <= self.focused_index < len(self.data) else None
+        self.data = _by_title(items)
+        if focused is not None:
+            self.focused_index = self.index_of(focused)
+
+    def game_at(self, index):
+        return self.data[index]["game_info"]
+
+    def index_of(self, game_info):
+        # Linear, but only used when the library watcher reports a change
+        for index, item in enumerate(self.data):
+            if item["game_info"].rom_path == game_info.rom_path:
+                return index
+        return -1
+
+    def remove_game(self, game_info):
+        index = self.index_of(game_info)
+        if index >= 0:
+            if index == self.focused_index:
+                self.focused_index = -1
+            elif index < self.focused_index:
+                self.focused_index -= 1
+            self._letter_starts = None
+            del self.data[index]
+
+    def replace_game(self, old_info, new_info):
+        index = self.index_of(old_info)
+        if index >= 0:
+            self._letter_starts = None
+            self.data[index] = {"game_info": new_info, "focused": self.data[index]["focused"]}
+            if self.sort_by_title and _title_key(new_info) != _title_key(old_info):
+                self._resort(self.data)
+
+    def set_focus(self, index, focused):
+        # Update the model so a recycled tile picks it up, and the live tile if it's on screen
+        self.data[index]["focused"] = focused
+        view = self.view_adapter.get_visible_view(index)
+        if view is not None:
+            view.set_focus(focused)
+        if focused:
+            App.get_running_app().on_game_focused(self.game_at(index))
+
+    def letter_starts(self):
+        """
+        Indexes where the first letter of the titles changes, always starting with 0;
+        used for LT/RT letter jumps, so only meaningful with sort_by_title. Rebuilt
+        lazily after the data changes.
+        """
+        if self._letter_starts is None:
+            starts, previous = [], None
+            for index, item in enumerate(self.data):
+                letter = _title_key(item["game_info"])[:1]
+                if letter != previous:
+                    starts.append(index)
+                    previous = letter
+            self._letter_starts = starts or [0]
+        return self._letter_starts
+
+    def visible_rows(self):
+        return max(1, int(self.height // (TILE_HEIGHT + self.layout_manager.spacing[1])))
+
+    def focus(self, index):
+        # Moves the single focus highlight; only the old and new tiles are touched
+        if self.focused_index == index:
+            return
+        self.clear_focus()
+        self.focused_index = index
+        self.set_focus(index, True)
+
+    def clear_focus(self):
+        if 0 <= self.focused_index < len(self.data):
+            self.set_focus(self.focused_index, False)
+        self.focused_index = -1
+
+    def press(self, index):
+        play_game(self.game_at(index))
+
+    def toggle_favorite(self, index):
+        view = self.view_adapter.get_visible_view(index)
+        if view is not None:
+            view.toggle_favorite()
+        else:
+            toggle_favorite(self.game_at(index))
+
+    def _on_scrolled(self, *args):
+        for views in self.view_adapter.dirty_views.values():
+            for view in views.values():
+                view.cancel_cover()
+
+        visible = self.view_adapter.views
+        if not visible:
+            return
+        # Kivy can hand a scrolled-out tile back for the same index without refreshing it
+        for view in visible.values():
+            view.ensure_cover()
+        first, last = min(visible), max(visible)
+        ahead = range(max(0, first - 2 * self.cols), min(len(self.data), last + 1 + 2 * self.cols))
+        App.get_running_app().cover_loader.prefetch(
+            game.cover_path for game in (self.game_at(i) for i in ahead if i not in visible)
+            if not game.has_default_cover
         )
 
+    def scroll_to_index(self, index):
+        # Coalesced: however many focus moves land in a frame, the grid scrolls once
+        self._scroll_index = index
+        self._scroll_trigger_focus()
+
+    def _apply_scroll(self, *args):
+        # Scroll just enough to bring the row containing the focused index into view
+        index = self._scroll_index
+        lm = self.layout_manager
+        scrollable = lm.height - self.height
+        if index is None or scrollable <= 0:
+            return
+
+        row_height = TILE_HEIGHT + lm.spacing[1]
+        row_top = lm.padding[1] + (index // self.cols) * row_height
+        row_bottom = row_top + TILE_HEIGHT
+
+        # Measure from where a running scroll will end up, not where it is mid-animation
+        scroll_y = self._scroll_goal if self._scroll_goal is not None else self.scroll_y
+        view_top = (1 - scroll_y) * scrollable
+        if row_top < view_top:
+            view_top = row_top
+        elif row_bottom > view_top + self.height:
+            view_top = row_bottom - self.height
+        else:
+            return
+
+        # One short animation at a time; a newer target replaces the running one
+        self._scroll_goal = min(1, max(0, 1 - view_top / scrollable))
+        Animation.cancel_all(self, "scroll_y")
+        animation = Animation(scroll_y=self._scroll_goal, duration=SCROLL_DURATION)
+        animation.bind(on_complete=self._on_scroll_done)
+        animation.start(self)
+
+    def _on_scroll_done(self, *args):
+        self._scroll_goal = None
+
 
 class StarButton(ButtonBehavior, KivyImage):
     def __init__(self, **kwargs):
@@ -181,7 +450,7 @@ class TabButton(ButtonBehavior, BoxLayout):
             self.bind(size=self._update_rect, pos=self._update_rect)
 
         if icon_path:
-            self.icon = KivyImage(source=icon_path, size_hint=(None, None), size=(24, 24))
+            self.icon = KivyImage(source=asset(icon_path), size_hint=(None, None), size=(24, 24))
             self.add_widget(self.icon)
 
         self.label = Label(text=text_label, color=(1, 1, 1, 1), bold=True, halign='center', valign='middle')
@@ -210,24 +479,16 @@ class PlatformScreen(Screen):
         title = Label(text=platform, size_hint_y=None, height=50, font_size=24)
         layout.add_widget(title)
 
-        # Scrollable Game Grid
-        self.grid = GridLayout(
-            cols=5,
-            spacing=10,
-            padding=10,
-            size_hint_y=None
-        )
-        self.grid.bind(minimum_height=self.grid.setter('height'))
-
-        for game in games:
-            self.grid.add_widget(GameButton(game))
-
-        scroll_view = ScrollView(size_hint=(1, 1))
-        scroll_view.add_widget(self.grid)
+        # Scrollable, recycled Game Grid
+        self.grid = GameGrid(games, cols=5, sort_by_title=True, size_hint=(1, 1))
 
-        layout.add_widget(scroll_view)
+        layout.add_widget(self.grid)
         self.add_widget(layout)
 
+    def add_games(self, games):
+        # Appends games that arrive while the background scan is still running
+        self.grid.add_games(games)
+
 
 class HomeScreen(Screen):
     def __init__(self, all_games, **kwargs):
@@ -235,6 +496,7 @@ class HomeScreen(Screen):
 
         super(HomeScreen, self).__init__(name="Home", **kwargs)
         self.all_games = all_games
+        self.search_index = SearchIndex(all_games)
 
         self.layout = BoxLayout(orientation='vertical', spacing=10)
         self.add_widget(self.layout)
@@ -249,8 +511,29 @@ class HomeScreen(Screen):
         scroll_wrapper.add_widget(anchor)
         self.layout.add_widget(scroll_wrapper)
 
+        # Search results live in one label + recycled grid that is reused for every query
+        self.result_label = Label(text="🔍 Search Results", size_hint_y=None, height=30, color=(1, 1, 1, 1))
+        self.result_grid = GameGrid(cols=5, size_hint=(1, None), height=250)
+        self._showing_results = False
+        self._search_generation = 0
+        self._pending_query = ""
+        self._search_trigger = Clock.create_trigger(self._run_search, SEARCH_DEBOUNCE)
+
         self._rebuild_content()
 
+    def add_games(self, games):
+        self.all_games.extend(games)
+        self.search_index.add(games)
+        if self.search_input.text.strip():
+            self.on_search(self.search_input, self.search_input.text)
+
+    def remove_games(self, games):
+        paths = {g.rom_path for g in games}
+        self.all_games[:] = [g for g in self.all_games if g.rom_path not in paths]
+        self.search_index.remove(games)
+        if self.search_input.text.strip():
+            self.on_search(self.search_input, self.search_input.text)
+
     def _build_search_bar(self):
         search_bar_box = BoxLayout(size_hint_y=None, height=50, padding=[10, 5], spacing=10)
         with search_bar_box.canvas.before:
@@ -259,7 +542,7 @@ class HomeScreen(Screen):
             search_bar_box.bind(size=lambda inst, val: setattr(self.rect, 'size', val))
             search_bar_box.bind(pos=lambda inst, val: setattr(self.rect, 'pos', val))
 
-        search_icon = KivyImage(source="assets/search.png", size_hint=(None, 1), size=(30, 30))
+        search_icon = KivyImage(source=asset("assets/search.png"), size_hint=(None, 1), size=(30, 30))
         self.search_input = TextInput(
             hint_text="Search games...",
             size_hint=(1, 1),
@@ -278,8 +561,10 @@ class HomeScreen(Screen):
 
         total_height = 0  # Track total height manually
 
+        db = _library_db()
+
         # --- Favorites Section ---
-        favorites = load_favorites()
+        favorites = db.favorites() if db is not None else get_favorites_store().games()
         if favorites:
             fav_section = BoxLayout(orientation='vertical', size_hint_y=None, spacing=5)
             fav_label = self._create_section_header("assets/star.png", "Favorites")
@@ -299,7 +584,8 @@ class HomeScreen(Screen):
         recent_label = self._create_section_header("assets/joystick.png", "Recently Played")
 
         recent_grid = GridLayout(cols=5, spacing=10, padding=10, size_hint_y=None, height=250)
-        for game in load_recent_games()[:5]:
+        recent_games = db.recent(5) if db is not None else load_recent_games()[:5]
+        for game in recent_games:
             recent_grid.add_widget(GameButton(game))
 
         recent_section.add_widget(recent_label)
@@ -331,15 +617,42 @@ class HomeScreen(Screen):
         self.dynamic_section.height = total_height + 80
 
     def on_search(self, instance, value):
-        self.dynamic_section.clear_widgets()
-        if value.strip() == "":
+        # Every keystroke invalidates older queries; the search itself runs once typing pauses
+        self._search_generation += 1
+        self._pending_query = value
+        self._search_trigger.cancel()
+        self._search_trigger()
+
+    def _run_search(self, *args):
+        query = self._pending_query
+        generation = self._search_generation
+
+        if query.strip() == "":
+            self._showing_results = False
             self._rebuild_content()
-        else:
-            filtered = [g for g in self.all_games if value.lower() in g['title'].lower()]
-            result_label = Label(text="🔍 Search Results", size_hint_y=None, height=30, color=(1, 1, 1, 1))
-            result_grid = self._create_game_grid(filtered)
-            self.dynamic_section.add_widget(result_label)
-            self.dynamic_section.add_widget(self._wrap_scroll(result_grid))
+            return
+
+        def search():
+            results = self.search_index.search(query)
+            Clock.schedule_once(partial(self._show_results, generation, results))
+
+        threading.Thread(target=search, daemon=True).start()
+
+    def _show_results(self, generation, results, *args):
+        # A newer keystroke arrived while this search ran; its own results will follow
+        if generation != self._search_generation:
+            return
+
+        if not self._showing_results:
+            self.dynamic_section.clear_widgets()
+            self.dynamic_section.add_widget(self.result_label)
+            self.dynamic_section.add_widget(self.result_grid)
+            self._showing_results = True
+
+        # Tiles are recycled across queries; games still in the results keep their tile state
+        if [item["game_info"] for item in self.result_grid.data] != results:
+            self.result_grid.set_games(results)
+            self.result_grid.scroll_y = 1
 
     def _create_game_grid(self, game_list):
         layout = GridLayout(
@@ -373,7 +686,7 @@ class HomeScreen(Screen):
             pos_hint={"center_x": 0.5}  # Center the whole section header
         )
 
-        icon = KivyImage(source=icon_path, size_hint=(None, None), size=(24, 24))
+        icon = KivyImage(source=asset(icon_path), size_hint=(None, None), size=(24, 24))
         label = Label(
             text=label_text,
             color=(1, 1, 1, 1),
@@ -393,63 +706,80 @@ class HomeScreen(Screen):
 
 class SuperConsoleLauncher(App):
 
+    def on_stop(self):
+        # Write out any favorite toggles still waiting on the save timer
+        get_favorites_store().flush()
+        if getattr(self, "library_watcher", None) is not None:
+            self.library_watcher.stop()
+        if getattr(self, "rom_hasher", None) is not None:
+            self.rom_hasher.shutdown()
+        if getattr(self, "cover_loader", None) is not None:
+            self.cover_loader.stop()
+        if getattr(self, "pre_warmer", None) is not None:
+            self.pre_warmer.cancel()
+
     def pause_controller_input(self):
+        self.input.cancel_repeat()
         try:
-            Window.unbind(on_joy_button_down=self.on_joy_button_down)
-            Window.unbind(on_joy_axis=self.on_joy_axis)
-            Window.unbind(on_joy_hat=self.on_joy_hat)
+            Window.unbind(on_joy_button_down=self.input.on_joy_button_down)
+            Window.unbind(on_joy_button_up=self.input.on_joy_button_up)
+            Window.unbind(on_joy_axis=self.input.on_joy_axis)
+            Window.unbind(on_joy_hat=self.input.on_joy_hat)
         except Exception:
             pass
 
     def resume_controller_input(self):
-        Window.bind(on_joy_button_down=self.on_joy_button_down)
-        Window.bind(on_joy_axis=self.on_joy_axis)
-        Window.bind(on_joy_hat=self.on_joy_hat)
-
-    def launch_game_and_release(self, platform, rom_path):
+        Window.bind(on_joy_button_down=self.input.on_joy_button_down)
+        Window.bind(on_joy_button_up=self.input.on_joy_button_up)
+        Window.bind(on_joy_axis=self.input.on_joy_axis)
+        Window.bind(on_joy_hat=self.input.on_joy_hat)
+
+    def on_game_focused(self, game_info):
+        if self.pre_warmer is not None:
+            self.pre_warmer.focus(game_info.platform, game_info.rom_path)
+
+    def launch_game_and_release(self, platform, rom_path, title=None):
+        prewarmed = False
+        if self.pre_warmer is not None:
+            prewarmed = self.pre_warmer.is_warm(platform, rom_path)
+            # Don't compete with the emulator's own startup reads
+            self.pre_warmer.cancel()
+
+        session = self.emulator_supervisor.launch(platform, rom_path, title)
+        if session is None:
+            return
+        session.prewarmed = prewarmed
+        self._awaiting_window = session
         # Stop Kivy from owning the controller while the emulator runs
         self.pause_controller_input()
 
-        # IMPORTANT: make launch_game(...) return a subprocess.Popen in src/gameLauncher.py
-        proc = launch_game(platform, rom_path)
-
-        # If launch_game returns a Popen, wait and then rebind input
-        def wait_and_rebind():
-            try:
-                if hasattr(proc, "wait"):
-                    proc.wait()
-            finally:
+    def _on_window_focus(self, window, focused):
+        # The launcher losing focus right after a launch means the emulator's window came up
+        session, self._awaiting_window = self._awaiting_window, None
+        if session is not None and not focused and session.running:
+            session.window_latency = session.elapsed()
+            print(f"Launch to window: {session.window_latency:.2f}s for {session.title}"
+                  f"{' (pre-warmed)' if session.prewarmed else ''}")
+
+    def _on_emulator_exit(self, session):
+        # Called on the supervisor's monitor thread; give the controller back once nothing is running
+        def resume(dt):
+            self._show_session(session)
+            if not self.emulator_supervisor.running():
                 self.resume_controller_input()
+        Clock.schedule_once(resume)
 
-        threading.Thread(target=wait_and_rebind, daemon=True).start()
-
-    def on_key_down(self, window, keycode, scancode, codepoint, modifiers):
-        global focused_game_index, focused_game_buttons
-
-        key_name = keycode[1] if isinstance(keycode, tuple) else keycode
-        print("Key pressed:", key_name)
-
-        if not focused_game_buttons:
-            return False
-
-        focused_game_buttons[focused_game_index].set_focus(False)
-
-        if key_name == 'up':
-            focused_game_index = max(0, focused_game_index - 4)
-        elif key_name == 'down':
-            focused_game_index = min(len(focused_game_buttons) - 1, focused_game_index + 4)
-        elif key_name == 'left':
-            focused_game_index = max(0, focused_game_index - 1)
-        elif key_name == 'right':
-            focused_game_index = min(len(focused_game_buttons) - 1, focused_game_index + 1)
-        elif key_name in ('enter', 'numpadenter'):
-            focused_game_buttons[focused_game_index].dispatch('on_press')
-            return True
-
-        focused_game_buttons[focused_game_index].set_focus(True)
-        self.scroll_to_focused_game()
-
-        return True
+    def _show_session(self, session):
+        # How the last game ended, next to the HUD; the full record is in logs/sessions.jsonl
+        if not session.crashed:
+            minutes = int(session.duration // 60)
+            self.hud.set_status(f"Last played: {session.title} ({minutes} min)")
+            return
+        text = f"{session.title} crashed (exit code {session.exit_code})"
+        last_line = next((line.strip() for line in reversed(session.stderr_tail.splitlines()) if line.strip()), "")
+        if last_line:
+            text += "\n" + (last_line if len(last_line) <= 70 else last_line[:67] + "...")
+        self.hud.set_status(text, error=True)
 
     def update_hud_context(self, context):
         if not hasattr(self, "hud"):
@@ -465,21 +795,16 @@ class SuperConsoleLauncher(App):
             self.hud.set_actions(a_text="Play", y_text="Toggle Favorite")
 
     def scroll_to_focused_game(self):
-        current_screen = self.sm.get_screen(self.sm.current)
-        if hasattr(current_screen, 'children') and current_screen.children:
-            boxlayout = current_screen.children[0]  # Vertical layout
-            if boxlayout.children:
-                scroll = boxlayout.children[0]  # ScrollView
-                if hasattr(scroll, 'children') and scroll.children:
-                    grid = scroll.children[0]  # GridLayout inside ScrollView
-                    if 0 <= focused_game_index < len(focused_game_buttons):
-                        target = focused_game_buttons[focused_game_index]
-                        scroll.scroll_to(target)
+        grid, index = self.input.grid, self.input.index
+        if grid is not None and 0 <= index < len(grid.data):
+            grid.scroll_to_index(index)
 
     def build(self):
-        Window.bind(on_key_down=self.on_key_down)
-        Window.bind(on_joy_hat=self.on_joy_hat)
-        Window.bind(on_joy_axis=self.on_joy_axis)
+        # All keyboard/controller navigation goes through one dispatcher and its focus state
+        self.input = InputDispatcher(self)
+        Window.bind(on_key_down=self.input.on_key_down)
+        Window.bind(on_joy_hat=self.input.on_joy_hat)
+        Window.bind(on_joy_axis=self.input.on_joy_axis)
         screen_width, screen_height = Window.system_size
         Window.size = (screen_width, screen_height)
         Window.borderless = False
@@ -494,60 +819,66 @@ class SuperConsoleLauncher(App):
 
         self.sm = ScreenManager()
 
-        # --- Controller axis handling config ---
-        from kivy.clock import Clock
-        self._axis_deadzone = 0.35
-        self._axis_repeat_delay = 0.18  # seconds; optional repeat if you add later
-        # Track per-axis engaged state so a held stick only fires once until it returns to deadzone
-        self._axis_engaged = {0: False, 1: False}
-        self.use_dpad_buttons = False  # If True, treat D-pad as buttons 11–14; otherwise rely on on_joy_hat
+        self.launcher_config = load_config()
+        self.platforms = {}
+
+        # Icons and the default cover come from one atlas texture built (or reused) here
+        self.asset_manager = AssetManager(cover_size=self.launcher_config["thumbnail_size"])
+
+        self.library_db = None
+        if self.launcher_config["library_db"]:
+            self.library_db = LibraryDatabase()
+            self.library_db.import_favorites(get_favorites_store().games())
+
+        # Resolve emulators.json now so a missing emulator is reported once at startup, not on click
+        get_registry()
+
+        # Every emulator launch goes through one supervisor, which logs each session in logs/
+        self.emulator_supervisor = get_supervisor()
+        self.emulator_supervisor.add_listener(self._on_emulator_exit)
+        self._awaiting_window = None
+        Window.bind(focus=self._on_window_focus)
+
+        # Optional read-ahead of the emulator and ROM for the tile the user is dwelling on
+        self.pre_warmer = None
+        if self.launcher_config["prewarm"]:
+            self.pre_warmer = PreWarmer(
+                dwell=self.launcher_config["prewarm_dwell"],
+                rom_mb=self.launcher_config["prewarm_rom_mb"]
+            )
+
+        # Covers are decoded by a small worker pool; tiles show the default cover until theirs is ready
+        self.cover_loader = CoverLoader(
+            workers=self.launcher_config["cover_workers"],
+            size=self.launcher_config["thumbnail_size"],
+            max_bytes=self.launcher_config["thumbnail_cache_mb"] * 1024 * 1024
+        )
 
-        all_games = scan_roms("ROMs/", "Covers/")
-        self.platforms = self.group_games_by_platform(all_games)
+        self.rom_hasher = None
+        if self.launcher_config["fingerprint_roms"]:
+            self.rom_hasher = RomHasher(workers=self.launcher_config["hash_workers"])
 
-        self.sm.add_widget(HomeScreen(all_games))
+        # Games are filled in by the background scan started at the end of build()
+        self.home_screen = HomeScreen([])
+        self.sm.add_widget(self.home_screen)
 
         # Tab bar with LB and RB icons
         self.tab_bar = BoxLayout(size_hint=(1, None), height=50, spacing=5, padding=[10, 0])
 
         self.tab_buttons = {}
         self.tab_order = []
-        global focused_tab_index
-        focused_tab_index = 0
 
         # Add LB icon to tab bar (left side)
-        lb_icon = KivyImage(source="assets/button_lb.png", size_hint=(None, 1), width=50)
+        lb_icon = KivyImage(source=asset("assets/button_lb.png"), size_hint=(None, 1), width=50)
         self.tab_bar.add_widget(lb_icon)
 
-        def highlight_tab(tag):
-            global focused_tab_index
-            for i, k in enumerate(self.tab_order):
-                btn = self.tab_buttons[k]
-                btn.highlight(k == tag)
-                if k == tag:
-                    focused_tab_index = i
-
-        def create_icon_text_button(icon_path, label_text, callback, tag):
-            btn = TabButton(icon_path=icon_path, text_label=label_text)
-            btn.bind(on_release=callback)
-            btn.bind(on_release=lambda inst: highlight_tab(tag))
-            self.tab_buttons[tag] = btn
-            self.tab_order.append(tag)
-            return btn
-
-        # Add Home button
-        home_btn = create_icon_text_button("assets/home.png", "Home", lambda x: self.switch_platform("Home"), "Home")
+        # Add Home button; platform buttons are inserted as the scan finds them
+        home_btn = self._create_tab_button("assets/home.png", "Home", lambda x: self.switch_platform("Home"), "Home")
+        self.tab_order.append("Home")
         self.tab_bar.add_widget(home_btn)
 
-        # Add platform buttons
-        for platform in self.platforms:
-            btn = create_icon_text_button(None, platform, lambda x, plat=platform: self.switch_platform(plat), platform)
-            self.tab_bar.add_widget(btn)
-            screen = PlatformScreen(platform, self.platforms[platform])
-            self.sm.add_widget(screen)
-
         # Add RB icon to tab bar (right side)
-        rb_icon = KivyImage(source="assets/button_rb.png", size_hint=(None, 1), width=50)
+        rb_icon = KivyImage(source=asset("assets/button_rb.png"), size_hint=(None, 1), width=50)
         self.tab_bar.add_widget(rb_icon)
 
         root.add_widget(self.tab_bar)
@@ -555,16 +886,13 @@ class SuperConsoleLauncher(App):
 
         self.current_tab_index = self.tab_order.index("Home")
 
-        self.tab_buttons[self.tab_order[focused_tab_index]].highlight(True)
-
         # Bind controller input
-        Window.bind(on_joy_button_down=self.on_joy_button_down)
+        Window.bind(on_joy_button_down=self.input.on_joy_button_down)
+        Window.bind(on_joy_button_up=self.input.on_joy_button_up)
 
         # Initial highlight
-        highlight_tab("Home")
+        self._highlight_tab("Home")
 
-        global focus_mode
-        focus_mode = "tab"
         self.hud = HUD()
         hud_anchor = AnchorLayout(anchor_x='right', anchor_y='bottom', size_hint=(1, None), height=120)
         hud_anchor.add_widget(self.hud)
@@ -572,230 +900,144 @@ class SuperConsoleLauncher(App):
 
         self.update_hud_context("tab")
 
-        return root
+        self._start_library_scan()
 
-    def group_games_by_platform(self, games):
-        grouped = {}
-        for game in games:
-            platform = game["platform"]
-            if platform not in grouped:
-                grouped[platform] = []
-            grouped[platform].append(game)
-        return grouped
+        return root
 
-    def switch_platform(self, platform, *args):
-        self.sm.current = platform
+    def _start_library_scan(self):
+        """
+        Scans the library on a background thread. Each finished scan pass is handed to
+        the main thread through Clock, so tabs and grids fill in while the UI stays live.
+        """
 
-        if platform != "Home" and platform in self.platforms:
-            screen = self.sm.get_screen(platform)
-            global focused_game_buttons, focused_game_index, focus_mode, focused_tab_index
-
-            if not screen.children:
-                return
-            root_layout = screen.children[0]
-
-            # Get the ScrollView
-            scroll = None
-            for ch in root_layout.children:
-                if ch.__class__.__name__ == "ScrollView":
-                    scroll = ch
-                    break
-            if scroll is None and root_layout.children:
-                scroll = root_layout.children[0]
-
-            # Get the GridLayout from the ScrollView
-            grid = scroll.children[0] if scroll and scroll.children else None
-            if grid is None:
-                focused_game_buttons = []
-                focused_game_index = 0
-            else:
-                # Clear ALL highlights
-                for child in grid.children:
-                    if hasattr(child, "set_focus"):
-                        child.set_focus(False)
-
-                # Rebuild button list in correct order
-                focused_game_buttons = [child for child in reversed(grid.children) if hasattr(child, "set_focus")]
-                focused_game_index = 0
-
-            # Start in tab mode
-            focus_mode = "tab"
-            self.update_hud_context("tab")
-
-            # Highlight the correct tab
-            for i, k in enumerate(self.tab_order):
-                self.tab_buttons[k].highlight(i == self.tab_order.index(platform))
-            focused_tab_index = self.tab_order.index(platform)
-
-    def on_joy_button_down(self, window, stickid, button):
-        global focused_game_index, focused_game_buttons
-        print("Controller button pressed:", button)
-
-        if button == 4:  # LB
-            self.hud.pulse_button(self.tab_bar.children[0])
-            self.current_tab_index = (self.current_tab_index - 1) % len(self.tab_order)
-            tag = self.tab_order[self.current_tab_index]
-            self.tab_buttons[tag].dispatch('on_release')
-
-        elif button == 5:  # RB
-            self.hud.pulse_button(self.tab_bar.children[-1])
-            self.current_tab_index = (self.current_tab_index + 1) % len(self.tab_order)
-            tag = self.tab_order[self.current_tab_index]
-            self.tab_buttons[tag].dispatch('on_release')
-        elif button == 11:  # D-pad up
-            if focused_game_buttons:
-                focused_game_buttons[focused_game_index].set_focus(False)
-                focused_game_index = max(0, focused_game_index - 4)
-                focused_game_buttons[focused_game_index].set_focus(True)
-        elif button == 12:  # D-pad down
-            if focused_game_buttons:
-                focused_game_buttons[focused_game_index].set_focus(False)
-                focused_game_index = min(len(focused_game_buttons) - 1, focused_game_index + 4)
-                focused_game_buttons[focused_game_index].set_focus(True)
-        elif button == 13:  # D-pad left
-            if focused_game_buttons:
-                focused_game_buttons[focused_game_index].set_focus(False)
-                focused_game_index = max(0, focused_game_index - 1)
-                focused_game_buttons[focused_game_index].set_focus(True)
-        elif button == 14:  # D-pad right
-            if focused_game_buttons:
-                focused_game_buttons[focused_game_index].set_focus(False)
-                focused_game_index = min(len(focused_game_buttons) - 1, focused_game_index + 1)
-                focused_game_buttons[focused_game_index].set_focus(True)
-
-        elif button == 0:
-            self.hud.pulse_button(self.hud.a_label)# A button
-            if focus_mode == "grid" and 0 <= focused_game_index < len(focused_game_buttons):
-                self.update_hud_context("grid")  # ✅ ADD
-                focused_game_buttons[focused_game_index].dispatch('on_press')
-            elif focus_mode == "tab":
-                self.update_hud_context("tab")  # ✅ ADD
-                tag = self.tab_order[focused_tab_index]
-                self.tab_buttons[tag].dispatch('on_release')
-        elif button == 1:  # B button
-            self.hud.pulse_button(self.hud.b_label)
-        elif button == 2:  # X button
-            self.hud.pulse_button(self.hud.x_label)
-        elif button == 3:  # Y button
-            self.hud.pulse_button(self.hud.y_label)
-            if focus_mode == "grid" and 0 <= focused_game_index < len(focused_game_buttons):
-                self.update_hud_context("grid")  # ✅ ADD
-                focused_game_buttons[focused_game_index].star_button.dispatch('on_press')
-
-    def on_joy_hat(self, window, stickid, hatid, value):
-        global focused_game_index, focused_game_buttons, focus_mode, focused_tab_index
-        print("D-pad event triggered. Focus mode:", focus_mode)
-        print("D-pad (hat) input:", value)
-        x, y = value
-
-        if focus_mode == "tab":
-            if x == 1:
-                focused_tab_index = (focused_tab_index + 1) % len(self.tab_order)
-            elif x == -1:
-                focused_tab_index = (focused_tab_index - 1) % len(self.tab_order)
-
-            for i, k in enumerate(self.tab_order):
-                self.tab_buttons[k].highlight(i == focused_tab_index)
-            self.current_tab_index = focused_tab_index
-
-            if y == -1:  # ↓ into grid
-                screen = self.sm.get_screen(self.sm.current)
-                if hasattr(screen, 'children') and screen.children:
-                    boxlayout = screen.children[0]  # This is the vertical layout
-                    scroll = boxlayout.children[0]  # This is the ScrollView
-                    if hasattr(scroll, 'children') and scroll.children:
-                        grid = scroll.children[0]  # This is the GridLayout with GameButtons
-                        focused_game_buttons = [
-                            child for child in reversed(grid.children)
-                            if isinstance(child, GameButton)
-                        ]
-                        focused_game_index = 0
-                        focus_mode = "grid"
-                        if focused_game_buttons:
-                            focused_game_buttons[focused_game_index].set_focus(True)
-                            self.update_hud_context("grid")
-                        return
-
-
-        elif focus_mode == "grid":
-            self.update_hud_context("grid")
-            if focused_game_buttons:
-                focused_game_buttons[focused_game_index].set_focus(False)
-
-            if y == 1:  # ↑ key
-                if focused_game_index < 5:
-                    # Top row → go to tab bar
-                    focus_mode = "tab"
-                    self.update_hud_context("tab")
-                    for i, k in enumerate(self.tab_order):
-                        self.tab_buttons[k].highlight(i == focused_tab_index)
-                    return
+        def scan():
+            try:
+                games_by_pass = iter_scan_roms(
+                    "ROMs/", "Covers/", workers=self.launcher_config["scan_workers"], db=self.library_db
+                )
+                for platform, games in games_by_pass:
+                    Clock.schedule_once(partial(self._on_games_scanned, platform, games))
+            except Exception as e:
+                # e.g. no ROMs/ folder yet; the watcher still starts so games added later show up
+                print(f"[ERROR] Library scan failed: {e}")
+
+            if self.launcher_config["watch_library"]:
+                self.library_watcher = LibraryWatcher(
+                    "ROMs/", "Covers/",
+                    on_changes=lambda deltas: Clock.schedule_once(partial(self._on_library_changed, deltas)),
+                    interval=self.launcher_config["watch_interval"],
+                    db=self.library_db
+                )
+                self.library_watcher.start()
+
+        threading.Thread(target=scan, daemon=True).start()
+
+    def _on_library_changed(self, deltas, *args):
+        """
+        Applies add/remove/rename/update deltas from the library watcher to self.platforms,
+        the Home search index and only the platform screens they touch.
+        """
+        for delta in deltas:
+            kind, game = delta[0], delta[1]
+            platform = game.platform
+
+            if kind == "added":
+                self._on_games_scanned(platform, [game])
+                continue
+
+            games = self.platforms.get(platform, [])
+            screen = self.sm.get_screen(platform) if self.sm.has_screen(platform) else None
+
+            if kind == "removed":
+                games[:] = [g for g in games if g.rom_path != game.rom_path]
+                self.home_screen.remove_games([game])
+                if screen is not None:
+                    screen.grid.remove_game(game)
+            else:  # "renamed" / "updated": swap the entry in place so grid order is kept
+                new_game = delta[2]
+                if kind == "renamed" and self.rom_hasher is not None:
+                    self.rom_hasher.renamed(game, new_game, self._on_rom_hashed())
                 else:
-                    focused_game_index = max(0, focused_game_index - 5)
-            elif y == -1:
-                focused_game_index = min(len(focused_game_buttons) - 1, focused_game_index + 5)
-            elif x == -1:
-                focused_game_index = max(0, focused_game_index - 1)
-            elif x == 1:
-                focused_game_index = min(len(focused_game_buttons) - 1, focused_game_index + 1)
-
-            if focused_game_buttons:
-                focused_game_buttons[focused_game_index].set_focus(True)
-                self.scroll_to_focused_game()
-
-    def on_joy_axis(self, window, stickid, axisid, value):
-        # Edge-triggered analog stick handling with deadzone and latch
-        if axisid not in (0, 1):
+                    self._fingerprint_games([new_game])
+                games[:] = [new_game if g.rom_path == game.rom_path else g for g in games]
+                self.home_screen.remove_games([game])
+                self.home_screen.add_games([new_game])
+                if screen is not None:
+                    screen.grid.replace_game(game, new_game)
+
+        # Keep the controller focus on a tile that still exists
+        self.input.clamp()
+
+    def _on_rom_hashed(self):
+        return self.library_db.set_fingerprint if self.library_db is not None else None
+
+    def _fingerprint_games(self, games):
+        # Content hashes are computed on background threads and only recorded, never awaited
+        if self.rom_hasher is not None:
+            self.rom_hasher.submit(games, self._on_rom_hashed())
+
+    def _on_games_scanned(self, platform, games, *args):
+        self.home_screen.add_games(games)
+        self._fingerprint_games(games)
+
+        if platform in self.platforms:
+            self.platforms[platform].extend(games)
+            # Screens that haven't been opened yet pick the games up when they're built
+            if self.sm.has_screen(platform):
+                self.sm.get_screen(platform).add_games(games)
+                self.input.clamp()  # the focused tile may have moved in the sorted grid
             return
 
-        # Only allow analog navigation in grid mode
-        if globals().get("focus_mode") != "grid":
-            return
-
-        # Deadzone check
-        if abs(value) < self._axis_deadzone:
-            self._axis_engaged[axisid] = False  # release latch so next deflection can fire
-            return
+        self.platforms[platform] = list(games)
+        self._add_platform_tab(platform)
 
-        # If stick is already engaged, ignore until it returns to deadzone
-        if self._axis_engaged.get(axisid, False):
-            return
-
-        # Latch once per deflection
-        self._axis_engaged[axisid] = True
+    def _ensure_platform_screen(self, platform):
+        # Platform screens are built the first time they're shown instead of at startup
+        if platform in self.platforms and not self.sm.has_screen(platform):
+            self.sm.add_widget(PlatformScreen(platform, self.platforms[platform]))
 
-        global focused_game_index, focused_game_buttons
-        if not focused_game_buttons:
+    def _prefetch_adjacent_screens(self, platform, *args):
+        # Build the LB/RB neighbours while the user is looking at this tab
+        if self.sm.current != platform or platform not in self.tab_order:
             return
+        position = self.tab_order.index(platform)
+        for offset in (-1, 1):
+            self._ensure_platform_screen(self.tab_order[(position + offset) % len(self.tab_order)])
+
+    def _add_platform_tab(self, platform):
+        # Keep platform tabs alphabetical after Home, whatever order the scan finishes in
+        position = 1
+        while position < len(self.tab_order) and self.tab_order[position].lower() < platform.lower():
+            position += 1
+        self.tab_order.insert(position, platform)
+
+        btn = self._create_tab_button(None, platform, lambda x, plat=platform: self.switch_platform(plat), platform)
+        # Kivy counts children from the right: index 0 is the RB icon
+        self.tab_bar.add_widget(btn, index=len(self.tab_order) - position)
+
+        self.input.tab_inserted(position)
+        if position <= self.current_tab_index:
+            self.current_tab_index += 1
+
+    def _highlight_tab(self, tag):
+        self.input.highlight_tab(self.tab_order.index(tag))
+
+    def _create_tab_button(self, icon_path, label_text, callback, tag):
+        btn = TabButton(icon_path=icon_path, text_label=label_text)
+        btn.bind(on_release=callback)
+        btn.bind(on_release=lambda inst: self._highlight_tab(tag))
+        self.tab_buttons[tag] = btn
+        return btn
 
-        # Clear current highlight
-        focused_game_buttons[focused_game_index].set_focus(False)
-
-        step_h = 1  # left/right step
-        step_v = 5  # up/down step (your grid has 5 columns)
-
-        if axisid == 0:  # Left/right
-            if value > 0:
-                focused_game_index = min(len(focused_game_buttons) - 1, focused_game_index + step_h)
-            else:
-                focused_game_index = max(0, focused_game_index - step_h)
+    def switch_platform(self, platform, *args):
+        self._ensure_platform_screen(platform)
+        self.sm.current = platform
 
-        elif axisid == 1:  # Up/down
-            if value > 0:
-                focused_game_index = min(len(focused_game_buttons) - 1, focused_game_index + step_v)
-            else:
-                # Moving up from top row → jump to tab mode
-                if focused_game_index < step_v:
-                    globals()["focus_mode"] = "tab"
-                    self.update_hud_context("tab")
-                    for i, k in enumerate(self.tab_order):
-                        self.tab_buttons[k].highlight(i == globals().get("focused_tab_index", 0))
-                    return
-                focused_game_index = max(0, focused_game_index - step_v)
+        if self.launcher_config["prefetch_adjacent_tabs"]:
+            Clock.schedule_once(partial(self._prefetch_adjacent_screens, platform), PREFETCH_DELAY)
 
-        # Set new highlight
-        focused_game_buttons[focused_game_index].set_focus(True)
-        self.scroll_to_focused_game()
+        # Focus goes back to the tab bar, with this screen's grid next in line
+        self.input.enter_screen(platform)
 
 
 class IconButton(ButtonBehavior, BoxLayout):
@@ -804,7 +1046,7 @@ class IconButton(ButtonBehavior, BoxLayout):
         self.padding = 10
         self.spacing = 5
 
-        self.image = KivyImage(source=image_path, size_hint=(1, 0.8))
+        self.image = KivyImage(source=asset(image_path), size_hint=(1, 0.8))
         self.label = Label(text=label_text, font_size=14, color=(1, 1, 1, 1), size_hint=(1, 0.2))
 
         self.add_widget(self.image)
@@ -845,7 +1087,22 @@ class HUD(RelativeLayout):
         self.add_widget(self.x_label)
         self.add_widget(self.b_label)
 
+        # Outcome of the last emulator session, to the left of the buttons
+        self.status_label = Label(
+            text="",
+            font_size=13,
+            halign='right',
+            valign='middle',
+            size_hint=(None, None),
+            size=(420, 60),
+            text_size=(420, 60),
+            pos_hint={"right": 0, "center_y": 0.5}
+        )
+        self.add_widget(self.status_label)
 
+    def set_status(self, text, error=False):
+        self.status_label.text = text
+        self.status_label.color = (1, 0.45, 0.45, 1) if error else (1, 1, 1, 0.8)
 
     def pulse_button(self, button):
         from kivy.animation import Animation
@@ -857,7 +1114,7 @@ class HUD(RelativeLayout):
 
         container = RelativeLayout(size_hint=(None, None), size=(60, 70))
 
-        icon = KivyImage(source=icon_path, size_hint=(None, None), size=(32, 32), pos_hint={"center_x": 0.5, "top": 1})
+        icon = KivyImage(source=asset(icon_path), size_hint=(None, None), size=(32, 32), pos_hint={"center_x": 0.5, "top": 1})
 
         label = Label(
             text="",
@@ -1,6 +1,7 @@
 import os
 from PIL import Image, ImageTk
 import re
+from src.paramSfo import read_sfo
 def load_image(path, size=(150, 200)):
     """
     Loads an image from disk, resizes it, and returns a Tkinter-compatible PhotoImage.
@@ -39,15 +40,7 @@ def clean_title(raw_title):
 
 
 def get_ps3_title_from_sfo(sfo_path):
-    try:
-        with open(sfo_path, "rb") as f:
-            content = f.read()
-            title_index = content.find(b'TITLE')  # Look for 'TITLE' field
-            if title_index != -1:
-                # Very naive parsing, not bulletproof, just works for many
-                start = title_index + 0x30
-                end = content.find(b'\x00', start)
-                return content[start:end].decode('utf-8', errors='ignore')
-    except Exception as e:
-        print(f"Error parsing {sfo_path}: {e}")
-    return None
+    """
+    Returns the TITLE field of a PARAM.SFO file, or None if it can't be read.
+    """
+    return read_sfo(sfo_path, ("TITLE",)).get("TITLE")